@@ -180,6 +180,10 @@ class PIIScanner:
             'figure', 'table', 'appendix', 'section', 'chapter',
             'hypothesis', 'finding', 'result', 'conclusion',
         }
+        # Compiled alternation over all known originals (see _anonymize_pattern)
+        self._anon_pattern: Optional[re.Pattern] = None
+        self._anon_lookup: Dict[str, str] = {}
+        self._anon_size = -1
 
     def is_likely_name(self, word: str) -> bool:
         """Heuristic: is this word likely a person's name?"""
@@ -310,19 +314,53 @@ class PIIScanner:
 
         return all_matches
 
+    def _anonymize_pattern(self) -> Optional[re.Pattern]:
+        """
+        Compile every known original into a single word-bounded alternation.
+
+        Alternatives are ordered longest first so that multi-word identifiers
+        win over their parts. The pattern is rebuilt only when the mappings
+        have grown since the last call.
+        """
+        size = len(self.mappings.mappings)
+        if size != self._anon_size:
+            items = sorted(self.mappings.mappings.items(), key=lambda x: -len(x[0]))
+            lookup: Dict[str, str] = {}
+            for original, hash_val in items:
+                lookup.setdefault(original.lower(), f'[HASH:{hash_val}]')
+            self._anon_lookup = lookup
+            self._anon_pattern = re.compile(
+                r'\b(?:' + '|'.join(re.escape(o) for o, _ in items) + r')\b',
+                re.IGNORECASE
+            ) if items else None
+            self._anon_size = size
+        return self._anon_pattern
+
+    def _replace_match(self, m: re.Match) -> str:
+        text = m.group(0)
+        return self._anon_lookup.get(text.lower(), text)
+
+    def has_pii(self, text: str) -> bool:
+        """Return True if text contains any known PII (no substitution)."""
+        pattern = self._anonymize_pattern()
+        return pattern is not None and pattern.search(text) is not None
+
     def anonymize(self, text: str) -> str:
         """Replace all known PII with hashes."""
-        result = text
-
-        # Sort by length (longest first) to avoid partial replacements
-        items = sorted(self.mappings.mappings.items(), key=lambda x: -len(x[0]))
-
-        for original, hash_val in items:
-            # Use word boundaries to avoid partial matches (e.g., "Mas" in "mass")
-            pattern = re.compile(r'\b' + re.escape(original) + r'\b', re.IGNORECASE)
-            result = pattern.sub(f'[HASH:{hash_val}]', result)
-
-        return result
+        # Word boundaries avoid partial matches (e.g., "Mas" in "mass")
+        pattern = self._anonymize_pattern()
+        if pattern is None:
+            return text
+        return pattern.sub(self._replace_match, text)
+
+    def anonymize_many(self, texts: List[str]) -> List[str]:
+        """Anonymize a batch of texts with one compiled pattern."""
+        pattern = self._anonymize_pattern()
+        if pattern is None:
+            return list(texts)
+        sub = pattern.sub
+        repl = self._replace_match
+        return [sub(repl, t) for t in texts]
 
 
 def hash_content(content: str, nonce: Optional[str] = None) -> Tuple[str, str]:
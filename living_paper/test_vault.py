@@ -0,0 +1,91 @@
+"""
+Tests for the evidence vault's storage behaviour.
+
+Run from the repository root with pytest; like vault.py itself, these
+import sibling modules from living_paper/ directly.
+"""
+
+import pytest
+
+from hasher import hash_content
+from vault import HAS_ZSTD, EvidenceItem, Vault, VaultError
+
+
+def _item(evidence_id: str, raw: str, tier: str = 'WITNESS_ONLY', **kwargs) -> EvidenceItem:
+    content_hash, nonce = hash_content(raw)
+    return EvidenceItem(
+        evidence_id=evidence_id,
+        evidence_type='quote',
+        tier=tier,
+        content_hash=content_hash,
+        nonce=nonce,
+        summary=kwargs.pop('summary', raw[:40]),
+        anonymized=raw,
+        raw=raw,
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def vault(tmp_path):
+    v = Vault(tmp_path)
+    v.init()
+    return v
+
+
+@pytest.mark.skipif(not HAS_ZSTD, reason="zstandard not installed")
+def test_compressed_content_round_trips_and_fails_without_codec(vault):
+    raw = "The sorter kept jamming whenever the night shift changed. " * 10
+    vault.store(_item('ev_1', raw))
+    assert vault.get_witness_only('ev_1', 'author', 'test')['raw_content'] == raw
+
+    vault._dctx = None
+    with pytest.raises(VaultError):
+        vault.get_witness_only('ev_1', 'author', 'test')
+
+
+def test_fts_index_tracks_upserts_and_is_not_rebuilt_on_reinit(vault):
+    vault.store(_item('ev_1', "robots on the night shift", tier='PUBLIC'))
+    vault.store(_item('ev_2', "managers reviewed dashboards", tier='PUBLIC'))
+    assert [r['evidence_id'] for r in vault.search('robots')] == ['ev_1']
+
+    # Upserting a row replaces its indexed summary
+    vault.store(_item('ev_1', "sorters on the day shift", tier='PUBLIC'))
+    assert vault.search('robots') == []
+    assert [r['evidence_id'] for r in vault.search('sorters')] == ['ev_1']
+
+    statements = []
+    vault.db.set_trace_callback(statements.append)
+    vault.init()
+    vault.db.set_trace_callback(None)
+    assert not any("'rebuild'" in sql for sql in statements)
+    assert [r['evidence_id'] for r in vault.search('dashboards')] == ['ev_2']
+
+
+def test_verify_hashes_inline_and_pooled_agree(vault, monkeypatch):
+    import vault as vault_module
+
+    short = [_item(f'ev_{i}', f"quote number {i}") for i in range(3)]
+    long = [_item(f'ev_long_{i}', f"long quote {i} " * 300) for i in range(4)]
+    vault.store_many(short + long)
+
+    assert vault.verify_hash('ev_0', "quote number 0")
+    assert not vault.verify_hash('ev_0', "quote number 1")
+    assert not vault.verify_hash('missing', "anything")
+
+    pairs = [(item.evidence_id, item.raw) for item in short + long]
+    pairs.append(('ev_1', "tampered"))
+    inline = vault.verify_hashes(pairs)
+
+    # Force the pooled path and check it gives the same answers
+    monkeypatch.setattr(vault_module, 'PARALLEL_VERIFY_MIN', 1)
+    monkeypatch.setattr(vault_module, 'HASHLIB_GIL_RELEASE_BYTES', 0)
+    assert vault.verify_hashes(pairs) == inline
+    assert inline['ev_0'] and inline['ev_long_3'] and not inline['ev_1']
+
+
+def test_meta_is_serialized_when_stored(vault):
+    item = _item('ev_1', "a quote", tier='PUBLIC', meta={'site': 'Alpha'})
+    item.meta['site'] = 'Beta'
+    vault.store(item)
+    assert '"Beta"' in vault.get_public('ev_1')['meta_json']
@@ -0,0 +1,40 @@
+"""
+Tests for the claim-evidence dashboard.
+
+Run from the repository root with pytest; like visualize.py itself, these
+import sibling modules from living_paper/ directly.
+"""
+
+import sqlite3
+
+import visualize
+
+HOSTILE = '"><script>alert(1)</script>'
+
+
+def _db():
+    # Same columns as the public schema, minus its CHECK constraints, so
+    # rows can carry markup the real schema would reject
+    db = sqlite3.connect(":memory:")
+    db.executescript("""
+        CREATE TABLE claim (claim_id, paper_id, claim_type, text, confidence,
+                            status, verification_status);
+        CREATE TABLE evidence (evidence_id, summary, sensitivity_tier);
+        CREATE TABLE claim_evidence_link (claim_id, evidence_id, relation);
+    """)
+    db.execute("INSERT INTO claim VALUES ('c1', 'p1', ?, ?, 0.5, 'draft', 'unverified')",
+               (HOSTILE, "Sites <learn> & adapt"))
+    db.execute("INSERT INTO evidence VALUES ('e1', 'summary', ?)", (HOSTILE,))
+    db.execute("INSERT INTO claim_evidence_link VALUES ('c1', 'e1', ?)", (HOSTILE,))
+    db.row_factory = sqlite3.Row
+    return db
+
+
+def test_dashboard_escapes_every_database_value(monkeypatch):
+    monkeypatch.setattr(visualize, 'get_db', _db)
+    html = visualize.generate_html()
+    assert "<script>" not in html and "<SCRIPT>" not in html
+    assert "Sites &lt;learn&gt; &amp; adapt" in html
+    # Claim type class, relation class and tag, tier; the label is upper-cased
+    assert html.count("&lt;script&gt;") == 4
+    assert "&lt;SCRIPT&gt;" in html
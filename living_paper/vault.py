@@ -12,28 +12,75 @@ Usage:
     python vault.py ingest --source <file> --tier <tier> --mappings <mappings.json>
     python vault.py query --evidence-id <id> --tier <tier>
     python vault.py export --tier PUBLIC --out <dir>
+    python vault.py search --project <path> "<query>"
 """
 from __future__ import annotations
 
 import argparse
 import hashlib
 import json
+import mmap
+import multiprocessing
 import os
 import secrets
 import sqlite3
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 from hasher import PIIMappings, PIIScanner, hash_content, generate_summary
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import zstandard
+    HAS_ZSTD = True
+except ImportError:
+    HAS_ZSTD = False
+
+# orjson decodes bytes directly; stdlib json accepts bytes as well
+json_loads = orjson.loads if HAS_ORJSON else json.loads
+
+
+def json_dumps(obj: Any) -> str:
+    if HAS_ORJSON:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
 ISO = "%Y-%m-%dT%H:%M:%SZ"
 
+# Below this many evidence lines, process-pool startup costs more than it saves
+PARALLEL_INGEST_MIN = 2000
+
+# Private content shorter than this is stored as plain text (zstd frames
+# carry enough overhead that compressing short quotes makes them bigger)
+COMPRESS_MIN_BYTES = 256
+ZSTD_LEVEL = 3
+
+# SQLite storage tuning for read-heavy access (export, stats, lookups)
+MMAP_SIZE = 256 * 1024 * 1024
+PAGE_SIZE = 8192
+
+# IDs per "IN (...)" query, below SQLite's default host-parameter limit
+SQL_VARIABLE_BATCH = 500
+
+# Hash verification goes to a thread pool only for batches at least this
+# large whose contents average at least HASHLIB_GIL_RELEASE_BYTES (hashlib
+# holds the GIL for smaller inputs, so threads would only add overhead)
+PARALLEL_VERIFY_MIN = 64
+HASHLIB_GIL_RELEASE_BYTES = 2048
+
 
 def now() -> str:
-    return datetime.utcnow().strftime(ISO)
+    # time.gmtime() avoids allocating a datetime per call
+    return time.strftime(ISO, time.gmtime())
 
 
 def die(msg: str, code: int = 2) -> None:
@@ -41,6 +88,10 @@ def die(msg: str, code: int = 2) -> None:
     raise SystemExit(code)
 
 
+class VaultError(Exception):
+    """Stored vault content can't be decoded (e.g. a missing optional codec)."""
+
+
 @dataclass
 class EvidenceItem:
     """A piece of evidence at a specific tier."""
@@ -66,6 +117,9 @@ class Vault:
     Uses two SQLite databases:
     - public.sqlite: PUBLIC tier data (summaries, hashes, metadata)
     - private.sqlite: CONTROLLED + WITNESS_ONLY data (anonymized/raw content, nonces)
+
+    Both files are opened on one shared connection (private.sqlite is
+    ATTACHed as schema ``private``) so a single COMMIT covers both tiers.
     """
 
     def __init__(self, project_path: Path):
@@ -76,31 +130,72 @@ class Vault:
         self.public_db_path = self.vault_dir / "public.sqlite"
         self.private_db_path = self.vault_dir / "private.sqlite"
 
-        self._public_db: Optional[sqlite3.Connection] = None
-        self._private_db: Optional[sqlite3.Connection] = None
+        self._db: Optional[sqlite3.Connection] = None
+
+        self._cctx = zstandard.ZstdCompressor(level=ZSTD_LEVEL) if HAS_ZSTD else None
+        self._dctx = zstandard.ZstdDecompressor() if HAS_ZSTD else None
+
+    def _pack(self, text: Optional[str]) -> Optional[Any]:
+        """Compress private content to a zstd BLOB (plain text if unavailable/short)."""
+        if text is None or self._cctx is None:
+            return text
+        data = text.encode('utf-8')
+        if len(data) < COMPRESS_MIN_BYTES:
+            return text
+        return self._cctx.compress(data)
+
+    def _unpack(self, value: Optional[Any]) -> Optional[str]:
+        """Inverse of _pack; TEXT values (older or short rows) pass through."""
+        if not isinstance(value, bytes):
+            return value
+        if self._dctx is None:
+            raise VaultError(
+                "vault contains zstd-compressed content; install with: pip install zstandard"
+            )
+        return self._dctx.decompress(value).decode('utf-8')
 
-    def _connect(self, path: Path) -> sqlite3.Connection:
-        db = sqlite3.connect(str(path))
+    def _connect(self) -> sqlite3.Connection:
+        db = sqlite3.connect(str(self.public_db_path))
         db.row_factory = sqlite3.Row
+        db.execute("ATTACH DATABASE ? AS private", (str(self.private_db_path),))
+        # Let reads go through the OS page cache instead of read() syscalls
+        db.execute(f"PRAGMA main.mmap_size={MMAP_SIZE}")
+        db.execute(f"PRAGMA private.mmap_size={MMAP_SIZE}")
         return db
 
+    @property
+    def db(self) -> sqlite3.Connection:
+        if self._db is None:
+            self._db = self._connect()
+        return self._db
+
     @property
     def public_db(self) -> sqlite3.Connection:
-        if self._public_db is None:
-            self._public_db = self._connect(self.public_db_path)
-        return self._public_db
+        return self.db
 
     @property
     def private_db(self) -> sqlite3.Connection:
-        if self._private_db is None:
-            self._private_db = self._connect(self.private_db_path)
-        return self._private_db
+        return self.db
 
     def init(self) -> None:
         """Initialize vault databases."""
+        # page_size only takes effect before either file gets its first
+        # table (and before switching to WAL), so both are set up front
+        self.db.executescript(f"""
+            PRAGMA main.page_size={PAGE_SIZE};
+            PRAGMA private.page_size={PAGE_SIZE};
+            PRAGMA main.journal_mode=WAL;
+            PRAGMA private.journal_mode=WAL;
+        """)
+
+        # The full-text index is back-populated only when it is first created;
+        # after that the triggers below keep it in sync row by row
+        fts_exists = self.db.execute(
+            "SELECT 1 FROM main.sqlite_master WHERE type = 'table' AND name = 'evidence_fts'"
+        ).fetchone() is not None
+
         # Public schema: safe to share
         self.public_db.executescript("""
-            PRAGMA journal_mode=WAL;
 
             CREATE TABLE IF NOT EXISTS evidence_public (
                 evidence_id TEXT PRIMARY KEY,
@@ -129,14 +224,40 @@ class Vault:
 
             CREATE INDEX IF NOT EXISTS idx_evidence_tier ON evidence_public(tier);
             CREATE INDEX IF NOT EXISTS idx_evidence_type ON evidence_public(evidence_type);
+
+            -- Full-text index over summaries (external content, kept in sync by triggers)
+            CREATE VIRTUAL TABLE IF NOT EXISTS evidence_fts USING fts5(
+                evidence_id UNINDEXED,
+                summary,
+                content='evidence_public',
+                content_rowid='rowid'
+            );
+
+            CREATE TRIGGER IF NOT EXISTS evidence_fts_ai AFTER INSERT ON evidence_public BEGIN
+                INSERT INTO evidence_fts(rowid, evidence_id, summary)
+                VALUES (new.rowid, new.evidence_id, new.summary);
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS evidence_fts_ad AFTER DELETE ON evidence_public BEGIN
+                INSERT INTO evidence_fts(evidence_fts, rowid, evidence_id, summary)
+                VALUES ('delete', old.rowid, old.evidence_id, old.summary);
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS evidence_fts_au AFTER UPDATE ON evidence_public BEGIN
+                INSERT INTO evidence_fts(evidence_fts, rowid, evidence_id, summary)
+                VALUES ('delete', old.rowid, old.evidence_id, old.summary);
+                INSERT INTO evidence_fts(rowid, evidence_id, summary)
+                VALUES (new.rowid, new.evidence_id, new.summary);
+            END;
         """)
-        self.public_db.commit()
 
-        # Private schema: protected
-        self.private_db.executescript("""
-            PRAGMA journal_mode=WAL;
+        if not fts_exists:
+            # Index rows stored before the FTS table existed
+            self.db.execute("INSERT INTO evidence_fts(evidence_fts) VALUES ('rebuild')")
 
-            CREATE TABLE IF NOT EXISTS evidence_private (
+        # Private schema: protected (qualified so it lands in private.sqlite)
+        self.private_db.executescript("""
+            CREATE TABLE IF NOT EXISTS private.evidence_private (
                 evidence_id TEXT PRIMARY KEY,
                 nonce TEXT NOT NULL,
                 anonymized_content TEXT,
@@ -146,7 +267,7 @@ class Vault:
                 created_at TEXT NOT NULL
             );
 
-            CREATE TABLE IF NOT EXISTS access_log (
+            CREATE TABLE IF NOT EXISTS private.access_log (
                 log_id INTEGER PRIMARY KEY AUTOINCREMENT,
                 evidence_id TEXT NOT NULL,
                 accessor_id TEXT,
@@ -155,7 +276,7 @@ class Vault:
                 created_at TEXT NOT NULL
             );
         """)
-        self.private_db.commit()
+        self.db.commit()
 
         # Create .gitignore for private db
         gitignore = self.vault_dir / ".gitignore"
@@ -166,49 +287,78 @@ class Vault:
 
     def store(self, item: EvidenceItem, paper_id: str = "default") -> None:
         """Store evidence item in appropriate tier."""
-        # Hash source file path
-        source_hash = None
-        if item.source_file:
-            source_hash = hashlib.sha256(item.source_file.encode()).hexdigest()[:16]
+        self.store_many([item], paper_id)
+
+    def store_many(self, items: List[EvidenceItem], paper_id: str = "default") -> None:
+        """Store a batch of evidence items under a single transaction."""
+        # All rows in a batch share one updated_at timestamp
+        ts = now()
+        public_rows = []
+        private_rows = []
+        for item in items:
+            # Hash source file path
+            source_hash = None
+            if item.source_file:
+                source_hash = hashlib.sha256(item.source_file.encode()).hexdigest()[:16]
+
+            public_rows.append((
+                item.evidence_id,
+                paper_id,
+                item.evidence_type,
+                item.tier,
+                item.content_hash,
+                item.summary,
+                source_hash,
+                item.source_line_start,
+                item.source_line_end,
+                json_dumps(item.meta),
+                item.created_at,
+                ts
+            ))
+            private_rows.append((
+                item.evidence_id,
+                item.nonce,
+                self._pack(item.anonymized) if item.tier in ('CONTROLLED', 'WITNESS_ONLY') else None,
+                self._pack(item.raw) if item.tier == 'WITNESS_ONLY' else None,
+                item.source_file,
+                item.created_at
+            ))
 
         # Public tier data
-        self.public_db.execute("""
-            INSERT OR REPLACE INTO evidence_public
+        self.db.executemany("""
+            INSERT INTO main.evidence_public
             (evidence_id, paper_id, evidence_type, tier, content_hash, summary,
              source_file_hash, source_line_start, source_line_end, meta_json,
              created_at, updated_at)
             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            item.evidence_id,
-            paper_id,
-            item.evidence_type,
-            item.tier,
-            item.content_hash,
-            item.summary,
-            source_hash,
-            item.source_line_start,
-            item.source_line_end,
-            json.dumps(item.meta),
-            item.created_at,
-            now()
-        ))
-        self.public_db.commit()
+            ON CONFLICT(evidence_id) DO UPDATE SET
+                paper_id = excluded.paper_id,
+                evidence_type = excluded.evidence_type,
+                tier = excluded.tier,
+                content_hash = excluded.content_hash,
+                summary = excluded.summary,
+                source_file_hash = excluded.source_file_hash,
+                source_line_start = excluded.source_line_start,
+                source_line_end = excluded.source_line_end,
+                meta_json = excluded.meta_json,
+                updated_at = excluded.updated_at
+        """, public_rows)
 
         # Private tier data
-        self.private_db.execute("""
-            INSERT OR REPLACE INTO evidence_private
+        self.db.executemany("""
+            INSERT INTO private.evidence_private
             (evidence_id, nonce, anonymized_content, raw_content,
              source_file_path, created_at)
             VALUES (?, ?, ?, ?, ?, ?)
-        """, (
-            item.evidence_id,
-            item.nonce,
-            item.anonymized if item.tier in ('CONTROLLED', 'WITNESS_ONLY') else None,
-            item.raw if item.tier == 'WITNESS_ONLY' else None,
-            item.source_file,
-            item.created_at
-        ))
-        self.private_db.commit()
+            ON CONFLICT(evidence_id) DO UPDATE SET
+                nonce = excluded.nonce,
+                anonymized_content = excluded.anonymized_content,
+                raw_content = excluded.raw_content,
+                source_file_path = excluded.source_file_path
+        """, private_rows)
+
+        # One commit flushes both tiers
+        self.db.commit()
 
     def get_public(self, evidence_id: str) -> Optional[Dict]:
         """Get public tier data for evidence."""
@@ -243,7 +393,7 @@ class Vault:
 
         return {
             **pub,
-            'anonymized_content': priv['anonymized_content']
+            'anonymized_content': self._unpack(priv['anonymized_content'])
         }
 
     def get_witness_only(self, evidence_id: str, accessor_id: str, purpose: str) -> Optional[Dict]:
@@ -269,26 +419,56 @@ class Vault:
 
         return {
             **pub,
-            'raw_content': priv['raw_content'],
+            'raw_content': self._unpack(priv['raw_content']),
             'source_file_path': priv['source_file_path']
         }
 
     def verify_hash(self, evidence_id: str, content: str) -> bool:
         """Verify that content matches stored hash."""
-        priv = self.private_db.execute(
-            "SELECT nonce FROM evidence_private WHERE evidence_id = ?",
-            (evidence_id,)
-        ).fetchone()
-
-        if not priv:
-            return False
-
-        pub = self.get_public(evidence_id)
-        if not pub:
-            return False
-
-        computed, _ = hash_content(content, priv['nonce'])
-        return computed == pub['content_hash']
+        return self.verify_hashes([(evidence_id, content)])[evidence_id]
+
+    def verify_hashes(self, items: List[Tuple[str, str]],
+                      max_workers: Optional[int] = None) -> Dict[str, bool]:
+        """
+        Verify many (evidence_id, content) pairs against their stored hashes.
+
+        Nonces and hashes are fetched with one joined query per batch of IDs.
+        Large batches of long content are hashed on a thread pool (hashlib
+        releases the GIL on large inputs); everything else is hashed inline.
+        Unknown evidence IDs verify as False.
+        """
+        ids = list({evidence_id for evidence_id, _ in items})
+        stored: Dict[str, Tuple[str, str]] = {}
+        for i in range(0, len(ids), SQL_VARIABLE_BATCH):
+            batch = ids[i:i + SQL_VARIABLE_BATCH]
+            placeholders = ','.join('?' * len(batch))
+            for row in self.db.execute(f"""
+                SELECT p.evidence_id, v.nonce, p.content_hash
+                FROM main.evidence_public p
+                JOIN private.evidence_private v ON v.evidence_id = p.evidence_id
+                WHERE p.evidence_id IN ({placeholders})
+            """, batch):
+                stored[row['evidence_id']] = (row['nonce'], row['content_hash'])
+
+        def check(pair: Tuple[str, str]) -> bool:
+            evidence_id, content = pair
+            if evidence_id not in stored:
+                return False
+            nonce, expected = stored[evidence_id]
+            computed, _ = hash_content(content, nonce)
+            return computed == expected
+
+        parallel = (
+            len(items) >= PARALLEL_VERIFY_MIN
+            and sum(len(content) for _, content in items)
+            >= HASHLIB_GIL_RELEASE_BYTES * len(items)
+        )
+        if not parallel:
+            return {evidence_id: check((evidence_id, content)) for evidence_id, content in items}
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            results = pool.map(check, items)
+            return {evidence_id: ok for (evidence_id, _), ok in zip(items, results)}
 
     def log_verification(self, evidence_id: str, verifier_id: str,
                          verification_type: str, result: str, notes: str = None) -> None:
@@ -329,6 +509,17 @@ class Vault:
 
         print(f"[vault] exported {len(rows)} items to {out_dir}")
 
+    def search(self, query: str, limit: int = 20) -> List[Dict]:
+        """Full-text search over PUBLIC tier summaries (FTS5 match syntax)."""
+        rows = self.public_db.execute("""
+            SELECT p.* FROM evidence_fts f
+            JOIN evidence_public p ON p.rowid = f.rowid
+            WHERE evidence_fts MATCH ? AND p.tier = 'PUBLIC'
+            ORDER BY f.rank
+            LIMIT ?
+        """, (query, limit)).fetchall()
+        return [dict(row) for row in rows]
+
     def stats(self) -> Dict:
         """Get vault statistics."""
         public_count = self.public_db.execute(
@@ -350,72 +541,127 @@ class Vault:
         }
 
 
+def _iter_lines(path: Path):
+    """Yield raw byte lines of a file via mmap (no per-line decode or buffering)."""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start = 0
+            while (end := mm.find(b"\n", start)) != -1:
+                yield mm[start:end]
+                start = end + 1
+            if start < len(mm):
+                yield mm[start:]
+
+
+def _build_items(scanner: PIIScanner,
+                 records: List[Tuple[int, Dict[str, Any], str]]) -> List[EvidenceItem]:
+    """Hash, anonymize and summarize (index, obj, raw) records into items."""
+    # Probe for PII first; only lines that contain some need substitution.
+    # Those are anonymized in one sweep with a single compiled pattern.
+    flagged = [scanner.has_pii(raw) for _, _, raw in records]
+    anonymized_iter = iter(scanner.anonymize_many(
+        [raw for (_, _, raw), has_pii in zip(records, flagged) if has_pii]
+    ))
+
+    ts = now()
+    items = []
+    for (index, obj, raw), has_pii in zip(records, flagged):
+        # Generate tiers
+        # 1. Hash the raw content
+        content_hash, nonce = hash_content(raw)
+
+        # 2. Anonymize (lines without PII pass through unchanged)
+        anonymized = next(anonymized_iter) if has_pii else raw
+
+        # 3. Generate summary
+        summary = generate_summary(anonymized, max_words=25)
+
+        # Determine tier based on content
+        tier = 'CONTROLLED' if has_pii else 'PUBLIC'
+
+        # Create evidence item
+        items.append(EvidenceItem(
+            evidence_id=obj.get('evidence_id', f"ev_{index:04d}"),
+            evidence_type=obj.get('evidence_type', 'quote'),
+            tier=tier,
+            content_hash=content_hash,
+            nonce=nonce,
+            summary=summary,
+            anonymized=anonymized,
+            raw=raw,
+            source_file=obj.get('source_file'),
+            source_line_start=obj.get('line_start'),
+            source_line_end=obj.get('line_end'),
+            meta={
+                'original_id': obj.get('evidence_id'),
+                'informant_role': obj.get('informant_role'),
+                'site': obj.get('site'),
+            },
+            created_at=ts
+        ))
+
+    return items
+
+
+# Per-process scanner for pooled ingest (set by _init_ingest_worker)
+_worker_scanner: Optional[PIIScanner] = None
+
+
+def _init_ingest_worker(mappings: PIIMappings) -> None:
+    global _worker_scanner
+    _worker_scanner = PIIScanner(mappings)
+
+
+def _ingest_chunk(records: List[Tuple[int, Dict[str, Any], str]]) -> List[EvidenceItem]:
+    return _build_items(_worker_scanner, records)
+
+
 def ingest_from_audit(vault: Vault, audit_dir: Path, mappings: PIIMappings,
-                      paper_id: str) -> int:
+                      paper_id: str, workers: Optional[int] = None) -> int:
     """
     Ingest evidence from existing audit output files.
 
     Reads evidence.jsonl, applies anonymization, stores in vault.
+
+    Hashing, anonymization and summaries are CPU-bound and independent per
+    line, so large files are split across ``workers`` processes (default:
+    one per CPU). Results are written back in file order in one transaction.
     """
     evidence_path = audit_dir / "evidence.jsonl"
     if not evidence_path.exists():
         die(f"evidence.jsonl not found in {audit_dir}")
 
-    scanner = PIIScanner(mappings)
-    count = 0
-
-    with open(evidence_path) as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-
-            obj = json.loads(line)
-
-            # Get raw content (try multiple field names)
-            raw = obj.get('content') or obj.get('text') or obj.get('quote') or ''
-            if not raw:
-                continue
-
-            # Generate tiers
-            # 1. Hash the raw content
-            content_hash, nonce = hash_content(raw)
-
-            # 2. Anonymize
-            anonymized = scanner.anonymize(raw)
-
-            # 3. Generate summary
-            summary = generate_summary(anonymized, max_words=25)
-
-            # Determine tier based on content
-            # If anonymization changed the text significantly, it had PII
-            has_pii = anonymized != raw
-            tier = 'CONTROLLED' if has_pii else 'PUBLIC'
-
-            # Create evidence item
-            item = EvidenceItem(
-                evidence_id=obj.get('evidence_id', f"ev_{count:04d}"),
-                evidence_type=obj.get('evidence_type', 'quote'),
-                tier=tier,
-                content_hash=content_hash,
-                nonce=nonce,
-                summary=summary,
-                anonymized=anonymized,
-                raw=raw,
-                source_file=obj.get('source_file'),
-                source_line_start=obj.get('line_start'),
-                source_line_end=obj.get('line_end'),
-                meta={
-                    'original_id': obj.get('evidence_id'),
-                    'informant_role': obj.get('informant_role'),
-                    'site': obj.get('site'),
-                }
-            )
+    records = []
+    for line in _iter_lines(evidence_path):
+        line = line.strip()
+        if not line:
+            continue
+
+        obj = json_loads(line)
+
+        # Get raw content (try multiple field names)
+        raw = obj.get('content') or obj.get('text') or obj.get('quote') or ''
+        if not raw:
+            continue
+
+        records.append((len(records), obj, raw))
 
-            vault.store(item, paper_id)
-            count += 1
+    if workers is None:
+        workers = os.cpu_count() or 1
 
-    return count
+    if workers > 1 and len(records) >= PARALLEL_INGEST_MIN:
+        size = -(-len(records) // workers)
+        chunks = [records[i:i + size] for i in range(0, len(records), size)]
+        with multiprocessing.Pool(workers, initializer=_init_ingest_worker,
+                                  initargs=(mappings,)) as pool:
+            items = [item for chunk in pool.imap(_ingest_chunk, chunks) for item in chunk]
+    else:
+        items = _build_items(PIIScanner(mappings), records)
+
+    vault.store_many(items, paper_id)
+    return len(items)
 
 
 # CLI
@@ -454,7 +700,7 @@ def ingest_cmd(args):
     audit_dir = Path(args.audit_dir).resolve()
     paper_id = args.paper_id or project_path.name
 
-    count = ingest_from_audit(vault, audit_dir, mappings, paper_id)
+    count = ingest_from_audit(vault, audit_dir, mappings, paper_id, args.workers)
     print(f"[vault] ingested {count} evidence items from {audit_dir}")
 
     # Save mappings snapshot
@@ -472,6 +718,17 @@ def export_cmd(args):
     vault.export_public(out_dir)
 
 
+def search_cmd(args):
+    """Search public summaries."""
+    project_path = Path(args.project).resolve()
+    vault = Vault(project_path)
+
+    results = vault.search(args.query, args.limit)
+    for row in results:
+        print(f"{row['evidence_id']}: {row['summary']}")
+    print(f"[vault] {len(results)} matches")
+
+
 def stats_cmd(args):
     """Show vault statistics."""
     project_path = Path(args.project).resolve()
@@ -499,26 +756,39 @@ def main():
     ing_p.add_argument('--mappings', '-m', help='PII mappings file')
     ing_p.add_argument('--paper-id', help='Paper ID (default: project name)')
     ing_p.add_argument('--names', help='Additional names (comma-separated)')
+    ing_p.add_argument('--workers', type=int,
+                       help='Worker processes for large files (default: CPU count)')
 
     # export
     exp_p = sub.add_parser('export', help='Export public tier')
     exp_p.add_argument('--project', '-p', required=True, help='Project path')
     exp_p.add_argument('--out', '-o', required=True, help='Output directory')
 
+    # search
+    search_p = sub.add_parser('search', help='Search public summaries')
+    search_p.add_argument('--project', '-p', required=True, help='Project path')
+    search_p.add_argument('query', help='FTS5 query (e.g. "robot AND sorter")')
+    search_p.add_argument('--limit', type=int, default=20, help='Maximum results')
+
     # stats
     stat_p = sub.add_parser('stats', help='Show vault statistics')
     stat_p.add_argument('--project', '-p', required=True, help='Project path')
 
     args = parser.parse_args()
 
-    if args.cmd == 'init':
-        init_cmd(args)
-    elif args.cmd == 'ingest':
-        ingest_cmd(args)
-    elif args.cmd == 'export':
-        export_cmd(args)
-    elif args.cmd == 'stats':
-        stats_cmd(args)
+    try:
+        if args.cmd == 'init':
+            init_cmd(args)
+        elif args.cmd == 'ingest':
+            ingest_cmd(args)
+        elif args.cmd == 'export':
+            export_cmd(args)
+        elif args.cmd == 'search':
+            search_cmd(args)
+        elif args.cmd == 'stats':
+            stats_cmd(args)
+    except VaultError as e:
+        die(str(e))
 
 
 if __name__ == '__main__':
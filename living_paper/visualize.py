@@ -4,253 +4,315 @@ Generate an HTML visualization of living paper claim-evidence relationships.
 Shows claim health, evidence balance, and areas needing attention.
 """
 
+import io
 import json
 import sqlite3
 from pathlib import Path
-from collections import defaultdict
+from collections import Counter
+from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
 
-def get_db():
-    db_path = Path(__file__).parent.parent / "analysis" / "living_paper" / "lp_public.sqlite"
-    conn = sqlite3.connect(str(db_path))
-    conn.row_factory = sqlite3.Row
-    return conn
-
-def generate_html():
-    db = get_db()
-
-    # Get all claims with paper info
-    claims = db.execute("""
-        SELECT c.claim_id, c.paper_id, c.claim_type, c.text, c.confidence, c.status, c.verification_status
-        FROM claim c
-        ORDER BY c.paper_id, c.claim_id
-    """).fetchall()
-
-    # Methodological note: empirical claims = almost always quant ground truth
-    # When qual contradicts quant, pause to ask what quant might be missing
-    # theoretical claims = mechanisms, can be challenged by qual evidence
+# Single-pass HTML escaping for text interpolated into the dashboard
+HTML_ESCAPE = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    "'": '&#x27;',
+})
 
-    # Get all links grouped by claim
-    links = db.execute("""
-        SELECT l.claim_id, l.evidence_id, l.relation, l.weight, l.note,
-               e.summary, e.sensitivity_tier, e.evidence_type
-        FROM claim_evidence_link l
-        JOIN evidence e ON e.evidence_id = l.evidence_id
-        ORDER BY l.claim_id, l.relation
-    """).fetchall()
-
-    # Group links by claim
-    claim_links = defaultdict(list)
-    for link in links:
-        claim_links[link['claim_id']].append(dict(link))
-
-    # Calculate health scores
-    def calc_health(links_list):
-        if not links_list:
-            return 0, "no-evidence"
-
-        supports = sum(1 for l in links_list if l['relation'] == 'supports')
-        challenges = sum(1 for l in links_list if l['relation'] == 'challenges')
-        qualifies = sum(1 for l in links_list if l['relation'] == 'qualifies')
-        total = len(links_list)
-
-        # Health = (supports - challenges) / total, scaled
-        if challenges > supports:
-            return -1, "challenged"
-        elif challenges > 0 and challenges >= supports * 0.5:
-            return 0.5, "contested"
-        elif qualifies > supports:
-            return 0.6, "qualified"
-        elif supports > 0:
-            return 1, "supported"
-        else:
-            return 0.3, "weak"
-
-    # Group claims by paper
-    papers = defaultdict(list)
-    for claim in claims:
-        c = dict(claim)
-        c['links'] = claim_links.get(claim['claim_id'], [])
-        c['health_score'], c['health_status'] = calc_health(c['links'])
-        papers[claim['paper_id']].append(c)
 
-    # Summary stats
-    total_claims = len(claims)
-    challenged = sum(1 for c in claims if calc_health(claim_links.get(c['claim_id'], []))[1] == 'challenged')
-    contested = sum(1 for c in claims if calc_health(claim_links.get(c['claim_id'], []))[1] == 'contested')
-    supported = sum(1 for c in claims if calc_health(claim_links.get(c['claim_id'], []))[1] == 'supported')
-
-    # Generate HTML
-    html = f"""<!DOCTYPE html>
+# Static page chrome, built once at import; only per-claim markup is
+# formatted when the dashboard is generated
+DASHBOARD_HEAD = """<!DOCTYPE html>
 <html>
 <head>
     <title>Living Paper Verification Dashboard</title>
     <style>
-        * {{ box-sizing: border-box; }}
-        body {{
+        * { box-sizing: border-box; }
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
             max-width: 1200px;
             margin: 0 auto;
             padding: 20px;
             background: #f5f5f5;
-        }}
-        h1 {{ color: #333; margin-bottom: 10px; }}
-        .summary {{
+        }
+        h1 { color: #333; margin-bottom: 10px; }
+        .summary {
             display: flex;
             gap: 20px;
             margin-bottom: 30px;
             flex-wrap: wrap;
-        }}
-        .stat-box {{
+        }
+        .stat-box {
             background: white;
             padding: 20px;
             border-radius: 8px;
             box-shadow: 0 2px 4px rgba(0,0,0,0.1);
             min-width: 150px;
-        }}
-        .stat-box .number {{ font-size: 36px; font-weight: bold; }}
-        .stat-box .label {{ color: #666; font-size: 14px; }}
-        .stat-box.red .number {{ color: #d32f2f; }}
-        .stat-box.yellow .number {{ color: #f57c00; }}
-        .stat-box.green .number {{ color: #388e3c; }}
-
-        .paper-section {{
+        }
+        .stat-box .number { font-size: 36px; font-weight: bold; }
+        .stat-box .label { color: #666; font-size: 14px; }
+        .stat-box.red .number { color: #d32f2f; }
+        .stat-box.yellow .number { color: #f57c00; }
+        .stat-box.green .number { color: #388e3c; }
+
+        .paper-section {
             background: white;
             margin-bottom: 20px;
             border-radius: 8px;
             box-shadow: 0 2px 4px rgba(0,0,0,0.1);
             overflow: hidden;
-        }}
-        .paper-header {{
+        }
+        .paper-header {
             background: #1976d2;
             color: white;
             padding: 15px 20px;
             font-size: 18px;
             font-weight: 600;
-        }}
-        .claim {{
+        }
+        .claim {
             border-bottom: 1px solid #eee;
             padding: 15px 20px;
-        }}
-        .claim:last-child {{ border-bottom: none; }}
-        .claim-header {{
+        }
+        .claim:last-child { border-bottom: none; }
+        .claim-header {
             display: flex;
             align-items: flex-start;
             gap: 12px;
-        }}
-        .health-indicator {{
+        }
+        .health-indicator {
             width: 12px;
             height: 12px;
             border-radius: 50%;
             margin-top: 5px;
             flex-shrink: 0;
-        }}
-        .health-supported {{ background: #4caf50; }}
-        .health-qualified {{ background: #8bc34a; }}
-        .health-contested {{ background: #ff9800; }}
-        .health-challenged {{ background: #f44336; }}
-        .health-weak {{ background: #9e9e9e; }}
-        .health-no-evidence {{ background: #e0e0e0; }}
-
-        .claim-text {{
+        }
+        .health-supported { background: #4caf50; }
+        .health-qualified { background: #8bc34a; }
+        .health-contested { background: #ff9800; }
+        .health-challenged { background: #f44336; }
+        .health-weak { background: #9e9e9e; }
+        .health-no-evidence { background: #e0e0e0; }
+
+        .claim-text {
             flex-grow: 1;
             font-size: 15px;
             line-height: 1.4;
-        }}
-        .claim-id {{
+        }
+        .claim-id {
             font-family: monospace;
             font-size: 12px;
             color: #666;
             background: #f0f0f0;
             padding: 2px 6px;
             border-radius: 3px;
-        }}
-        .confidence {{
+        }
+        .confidence {
             font-size: 12px;
             color: #666;
             margin-left: 8px;
-        }}
-        .claim-type {{
+        }
+        .claim-type {
             font-size: 10px;
             padding: 2px 6px;
             border-radius: 3px;
             margin-left: 8px;
             font-weight: 500;
-        }}
-        .claim-type.empirical {{ background: #e8f5e9; color: #2e7d32; }}
-        .claim-type.theoretical {{ background: #fff3e0; color: #e65100; }}
-        .claim-type.methodological {{ background: #e3f2fd; color: #1565c0; }}
-        .claim-meta {{
+        }
+        .claim-type.empirical { background: #e8f5e9; color: #2e7d32; }
+        .claim-type.theoretical { background: #fff3e0; color: #e65100; }
+        .claim-type.methodological { background: #e3f2fd; color: #1565c0; }
+        .claim-meta {
             display: flex;
             align-items: center;
             margin-bottom: 6px;
-        }}
+        }
 
-        .evidence-list {{
+        .evidence-list {
             margin-top: 10px;
             padding-left: 24px;
-        }}
-        .evidence-item {{
+        }
+        .evidence-item {
             font-size: 13px;
             padding: 6px 10px;
             margin: 4px 0;
             border-radius: 4px;
             display: flex;
             gap: 8px;
-        }}
-        .evidence-item.supports {{ background: #e8f5e9; border-left: 3px solid #4caf50; }}
-        .evidence-item.challenges {{ background: #ffebee; border-left: 3px solid #f44336; }}
-        .evidence-item.qualifies {{ background: #fff3e0; border-left: 3px solid #ff9800; }}
-        .evidence-item.illustrates {{ background: #e3f2fd; border-left: 3px solid #2196f3; }}
-        .evidence-item.necessitates {{ background: #f3e5f5; border-left: 3px solid #9c27b0; }}
-
-        .relation-tag {{
+        }
+        .evidence-item.supports { background: #e8f5e9; border-left: 3px solid #4caf50; }
+        .evidence-item.challenges { background: #ffebee; border-left: 3px solid #f44336; }
+        .evidence-item.qualifies { background: #fff3e0; border-left: 3px solid #ff9800; }
+        .evidence-item.illustrates { background: #e3f2fd; border-left: 3px solid #2196f3; }
+        .evidence-item.necessitates { background: #f3e5f5; border-left: 3px solid #9c27b0; }
+
+        .relation-tag {
             font-size: 11px;
             font-weight: 600;
             text-transform: uppercase;
             min-width: 70px;
-        }}
-        .evidence-summary {{
+        }
+        .evidence-summary {
             color: #333;
             flex-grow: 1;
-        }}
-        .evidence-tier {{
+        }
+        .evidence-tier {
             font-size: 10px;
             color: #999;
             padding: 1px 4px;
             background: #f0f0f0;
             border-radius: 2px;
-        }}
-        .evidence-tier.controlled {{ background: #fff3e0; color: #e65100; }}
+        }
+        .evidence-tier.controlled { background: #fff3e0; color: #e65100; }
 
-        .legend {{
+        .legend {
             display: flex;
             gap: 20px;
             margin-bottom: 20px;
             flex-wrap: wrap;
-        }}
-        .legend-item {{
+        }
+        .legend-item {
             display: flex;
             align-items: center;
             gap: 6px;
             font-size: 13px;
             color: #666;
-        }}
+        }
 
-        .paper-stats {{
+        .paper-stats {
             font-size: 13px;
             color: rgba(255,255,255,0.8);
             margin-top: 4px;
-        }}
+        }
 
-        details {{ cursor: pointer; }}
-        details summary {{ outline: none; }}
-        details summary::-webkit-details-marker {{ display: none; }}
+        details { cursor: pointer; }
+        details summary { outline: none; }
+        details summary::-webkit-details-marker { display: none; }
     </style>
 </head>
 <body>
     <h1>Living Paper Verification Dashboard</h1>
     <p style="color: #666; margin-bottom: 20px;">Claim-evidence traceability across your research papers</p>
+"""
+
+DASHBOARD_FOOT = """
+    <p style="color: #999; font-size: 12px; margin-top: 30px; text-align: center;">
+        Generated by living_paper verification system
+    </p>
+</body>
+</html>
+"""
+
+
+def get_db():
+    db_path = Path(__file__).parent.parent / "analysis" / "living_paper" / "lp_public.sqlite"
+    # The dashboard only reads: open read-only and tune for scans
+    conn = sqlite3.connect(f"{db_path.resolve().as_uri()}?mode=ro", uri=True)
+    conn.executescript("""
+        PRAGMA query_only = 1;
+        PRAGMA temp_store = MEMORY;
+        PRAGMA mmap_size = 268435456;
+        PRAGMA cache_size = -65536;
+    """)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+@lru_cache(maxsize=None)
+def calc_health(supports, challenges, qualifies, total):
+    """Score a claim from its link counts (few distinct inputs, so cached)."""
+    if not total:
+        return 0, "no-evidence"
+
+    # Health = (supports - challenges) / total, scaled
+    if challenges > supports:
+        return -1, "challenged"
+    elif challenges > 0 and challenges >= supports * 0.5:
+        return 0.5, "contested"
+    elif qualifies > supports:
+        return 0.6, "qualified"
+    elif supports > 0:
+        return 1, "supported"
+    else:
+        return 0.3, "weak"
+
+def generate_html(out=None):
+    """
+    Render the dashboard.
+
+    Streams chunks to ``out`` (any object with ``write``) when given;
+    otherwise returns the document as a string.
+    """
+    db = get_db()
+
+    # Get all claims with paper info
+    claims = db.execute("""
+        SELECT c.claim_id, c.paper_id, c.claim_type, c.text, c.confidence, c.status, c.verification_status
+        FROM claim c
+        ORDER BY c.paper_id, c.claim_id
+    """).fetchall()
+
+    # Methodological note: empirical claims = almost always quant ground truth
+    # When qual contradicts quant, pause to ask what quant might be missing
+    # theoretical claims = mechanisms, can be challenged by qual evidence
+
+    # Per-claim relation counts, aggregated by SQLite
+    health_counts = {
+        row['claim_id']: (row['supports'], row['challenges'], row['qualifies'], row['total'])
+        for row in db.execute("""
+            SELECT l.claim_id,
+                   SUM(CASE WHEN l.relation = 'supports' THEN 1 ELSE 0 END) AS supports,
+                   SUM(CASE WHEN l.relation = 'challenges' THEN 1 ELSE 0 END) AS challenges,
+                   SUM(CASE WHEN l.relation = 'qualifies' THEN 1 ELSE 0 END) AS qualifies,
+                   COUNT(*) AS total
+            FROM claim_evidence_link l
+            JOIN evidence e ON e.evidence_id = l.evidence_id
+            GROUP BY l.claim_id
+        """)
+    }
+
+    # Evidence detail is fetched per claim at render time, so only one
+    # claim's links are in memory at once (plain tuples, no sqlite3.Row)
+    links_cur = db.cursor()
+    links_cur.row_factory = None
+
+    def claim_links(claim_id):
+        return links_cur.execute("""
+            SELECT l.relation, e.summary, e.sensitivity_tier
+            FROM claim_evidence_link l
+            JOIN evidence e ON e.evidence_id = l.evidence_id
+            WHERE l.claim_id = ?
+            ORDER BY l.relation
+        """, (claim_id,))
 
+    # Group claims by paper; health is computed exactly once per claim here
+    def annotate(claim):
+        c = dict(claim)
+        c['link_counts'] = health_counts.get(claim['claim_id'], (0, 0, 0, 0))
+        c['health_score'], c['health_status'] = calc_health(*c['link_counts'])
+        return c
+
+    # Claims arrive ORDER BY paper_id, so each paper is one consecutive run
+    papers = [
+        (paper_id, [annotate(claim) for claim in group])
+        for paper_id, group in groupby(claims, key=itemgetter('paper_id'))
+    ]
+
+    # Summary stats (reuse the status stored on each claim)
+    status_counts = Counter(
+        c['health_status'] for _, paper_claims in papers for c in paper_claims
+    )
+    total_claims = len(claims)
+    challenged = status_counts['challenged']
+    contested = status_counts['contested']
+    supported = status_counts['supported']
+
+    # Generate HTML
+    buf = io.StringIO() if out is None else None
+    w = buf.write if out is None else out.write
+    w(DASHBOARD_HEAD)
+    w(f"""
     <div class="summary">
         <div class="stat-box">
             <div class="number">{total_claims}</div>
@@ -283,81 +345,79 @@ def generate_html():
         Usually, qual perceptions are mistaken beliefs (a finding in itself). Occasionally, qual reveals gaps in the quantitative record.
         Theoretical claims (mechanisms) can be challenged by qual, but quant behavioral patterns can rule out mechanisms.
     </div>
-"""
+""")
 
     # Paper name mapping - will use paper_id as fallback if not mapped
     paper_names = {}
 
-    for paper_id, paper_claims in papers.items():
+    for paper_id, paper_claims in papers:
         supports_count = sum(1 for c in paper_claims if c['health_status'] == 'supported')
         challenges_count = sum(1 for c in paper_claims if c['health_status'] in ('challenged', 'contested'))
 
-        html += f"""
+        w(f"""
     <div class="paper-section">
         <div class="paper-header">
-            {paper_names.get(paper_id, paper_id)}
+            {paper_names.get(paper_id, paper_id).translate(HTML_ESCAPE)}
             <div class="paper-stats">{len(paper_claims)} claims · {supports_count} supported · {challenges_count} need attention</div>
         </div>
-"""
+""")
         for claim in paper_claims:
             health_class = f"health-{claim['health_status']}"
             conf_pct = int(claim['confidence'] * 100)
             claim_type = claim['claim_type']
             type_label = "QUANT" if claim_type == "empirical" else "MECHANISM" if claim_type == "theoretical" else claim_type.upper()
+            claim_type, type_label = claim_type.translate(HTML_ESCAPE), type_label.translate(HTML_ESCAPE)
 
-            html += f"""
+            w(f"""
         <div class="claim">
             <div class="claim-header">
                 <div class="health-indicator {health_class}" title="{claim['health_status']}"></div>
                 <div class="claim-text">
                     <div class="claim-meta">
-                        <span class="claim-id">{claim['claim_id']}</span>
+                        <span class="claim-id">{claim['claim_id'].translate(HTML_ESCAPE)}</span>
                         <span class="claim-type {claim_type}">{type_label}</span>
                         <span class="confidence">{conf_pct}% confidence</span>
                     </div>
                     <details>
-                        <summary>{claim['text']}</summary>
+                        <summary>{claim['text'].translate(HTML_ESCAPE)}</summary>
                         <div class="evidence-list">
-"""
-            if claim['links']:
-                for link in claim['links']:
-                    tier_class = "controlled" if link['sensitivity_tier'] == 'CONTROLLED' else ""
-                    summary = "[CONTROLLED]" if link['sensitivity_tier'] == 'CONTROLLED' else link['summary'][:100]
-                    html += f"""
-                            <div class="evidence-item {link['relation']}">
-                                <span class="relation-tag">{link['relation']}</span>
+""")
+            if claim['link_counts'][3]:
+                for relation, link_summary, tier in claim_links(claim['claim_id']):
+                    tier_class = "controlled" if tier == 'CONTROLLED' else ""
+                    summary = "[CONTROLLED]" if tier == 'CONTROLLED' else link_summary[:100].translate(HTML_ESCAPE)
+                    relation, tier = relation.translate(HTML_ESCAPE), tier.translate(HTML_ESCAPE)
+                    w(f"""
+                            <div class="evidence-item {relation}">
+                                <span class="relation-tag">{relation}</span>
                                 <span class="evidence-summary">{summary}</span>
-                                <span class="evidence-tier {tier_class}">{link['sensitivity_tier']}</span>
+                                <span class="evidence-tier {tier_class}">{tier}</span>
                             </div>
-"""
+""")
             else:
-                html += """
+                w("""
                             <div class="evidence-item" style="background: #fafafa; border-left: 3px solid #ccc;">
                                 <span style="color: #999;">No evidence linked</span>
                             </div>
-"""
-            html += """
+""")
+            w("""
                         </div>
                     </details>
                 </div>
             </div>
         </div>
-"""
-        html += """
+""")
+        w("""
     </div>
-"""
+""")
 
-    html += """
-    <p style="color: #999; font-size: 12px; margin-top: 30px; text-align: center;">
-        Generated by living_paper verification system
-    </p>
-</body>
-</html>
-"""
-    return html
+    w(DASHBOARD_FOOT)
+    return buf.getvalue() if buf is not None else None
 
 if __name__ == "__main__":
     import sys
     out_path = Path(sys.argv[1]) if len(sys.argv) > 1 else Path(__file__).parent.parent / "analysis" / "living_paper" / "dashboard.html"
-    out_path.write_text(generate_html())
+    # Explicit UTF-8 and no newline translation on any platform
+    with open(out_path, 'w', encoding='utf-8', newline='') as f:
+        generate_html(f)
     print(f"Dashboard written to {out_path}")
@@ -37,6 +37,7 @@ from .coherence_validator import (
     CoherenceReport,
     CoherenceViolationType,
     validate_paper_coherence,
+    validate_corpus,
 )
 
 __all__ = [
@@ -66,6 +67,7 @@ __all__ = [
     'CoherenceReport',
     'CoherenceViolationType',
     'validate_paper_coherence',
+    'validate_corpus',
     # Document loaders
     'load_document',
     'load_latex',
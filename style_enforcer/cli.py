@@ -13,59 +13,121 @@ Usage:
     # Coherence validation only
     python -m style_enforcer.cli paper.tex --coherence-only
 
+    # Reuse coherence results from earlier runs on unchanged sections
+    python -m style_enforcer.cli paper.tex --coherence --cache-file .style_cache.sqlite
+
 Supported formats: .tex (LaTeX), .docx (Word), .md (Markdown)
 """
 
 import argparse
+import asyncio
+import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Iterator, Optional
 
 from .config import PaperType
 from .loaders import load_document, detect_format
 from .validator import StyleValidator, ValidationResult
 
 
+# LaTeX cleanup rules, compiled once at import and applied in order. Each
+# rule's literal prefix is checked first, so a pass only runs when the
+# (partially stripped) text can contain a match. The rules can't be fused
+# into one alternation: earlier passes change what later ones see (comments
+# hide braces and \end{...}, unwrapped arguments expose citations), and a
+# single pass gives different output on real manuscripts.
+LATEX_COMMENT_PATTERN = re.compile(r'%.*$', re.MULTILINE)
+LATEX_STRIP_RULES: tuple[tuple[str, re.Pattern, str], ...] = (
+    # \textit{text} -> text
+    ('\\textit{', re.compile(r'\\textit\{([^}]*)\}'), r'\1'),
+    ('\\textbf{', re.compile(r'\\textbf\{([^}]*)\}'), r'\1'),
+    ('\\emph{', re.compile(r'\\emph\{([^}]*)\}'), r'\1'),
+    # \cite{...}, \label{...}, \ref{...} are dropped
+    ('\\cite', re.compile(r'\\cite[pt]?\{[^}]*\}'), ''),
+    ('\\', re.compile(r'\\(label|ref|eqref)\{[^}]*\}'), ''),
+    # Figure/table environments (content handled separately)
+    ('\\begin{', re.compile(r'\\begin\{(figure|table)\}.*?\\end\{\1\}', re.DOTALL), ''),
+)
+
+
 def strip_latex_commands(text: str) -> str:
     """Remove common LaTeX commands for cleaner validation."""
-    # Remove comments
-    text = re.sub(r'%.*$', '', text, flags=re.MULTILINE)
+    # Every rule starts with '\\' or '%'; plain-text sections need no regex pass
+    if '\\' not in text and '%' not in text:
+        return text
 
-    # Remove common commands but preserve text content
-    # \textit{text} -> text
-    text = re.sub(r'\\textit\{([^}]*)\}', r'\1', text)
-    text = re.sub(r'\\textbf\{([^}]*)\}', r'\1', text)
-    text = re.sub(r'\\emph\{([^}]*)\}', r'\1', text)
+    # Comments go first so commented-out markup can't pair with live markup
+    if '%' in text:
+        text = LATEX_COMMENT_PATTERN.sub('', text)
+
+    for prefix, pattern, replacement in LATEX_STRIP_RULES:
+        if prefix in text:
+            text = pattern.sub(replacement, text)
 
-    # Remove \cite{...}
-    text = re.sub(r'\\cite[pt]?\{[^}]*\}', '', text)
+    return text
 
-    # Remove \label{...} and \ref{...}
-    text = re.sub(r'\\(label|ref|eqref)\{[^}]*\}', '', text)
 
-    # Remove figure/table environments (content handled separately)
-    text = re.sub(r'\\begin\{(figure|table)\}.*?\\end\{\1\}', '', text, flags=re.DOTALL)
+# Below this much section text, process start-up costs more than
+# validating the sections serially
+PARALLEL_VALIDATION_MIN_CHARS = 200_000
 
-    return text
+# Per-process validator for pooled validation (set by _init_validation_worker)
+_worker_validator: Optional[StyleValidator] = None
+
+
+def clean_sections(sections: dict[str, str], doc_format: Optional[str]) -> dict[str, str]:
+    """Strip LaTeX commands from every section of a LaTeX document."""
+    # Only strip LaTeX commands for LaTeX documents
+    if doc_format != 'latex':
+        return sections
+    return {name: strip_latex_commands(content) for name, content in sections.items()}
+
+
+def _init_validation_worker(paper_type: PaperType) -> None:
+    global _worker_validator
+    _worker_validator = StyleValidator(paper_type=paper_type)
+
+
+def _validate_section(item: tuple[str, str]) -> ValidationResult:
+    section_name, content = item
+    return _worker_validator.validate(content, section_name=section_name)
 
 
 def run_pattern_validation(
     sections: dict[str, str],
     paper_type: PaperType,
-    doc_format: str = 'latex',
+    doc_format: Optional[str] = 'latex',
 ) -> dict[str, ValidationResult]:
-    """Run pattern-based validation on all sections."""
+    """
+    Run pattern-based validation on all sections.
+
+    LaTeX sections are stripped first; pass doc_format=None for sections
+    already cleaned with clean_sections(). Sections are independent, so
+    long papers are validated on a process pool (the regex checks are pure
+    Python and hold the GIL, so threads would not help). Short papers stay
+    serial.
+    """
+    sections = clean_sections(sections, doc_format)
+    total_chars = sum(len(content) for content in sections.values())
+    workers = min(len(sections), os.cpu_count() or 1)
+    if workers > 1 and total_chars >= PARALLEL_VALIDATION_MIN_CHARS:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_validation_worker,
+            initargs=(paper_type,),
+        ) as pool:
+            return dict(zip(sections, pool.map(_validate_section, sections.items())))
+
     validator = StyleValidator(paper_type=paper_type)
     results = {}
 
     for section_name, content in sections.items():
-        # Only strip LaTeX commands for LaTeX documents
-        if doc_format == 'latex':
-            clean_content = strip_latex_commands(content)
-        else:
-            clean_content = content
         result = validator.validate(
-            clean_content,
+            content,
             section_name=section_name,
         )
         results[section_name] = result
@@ -73,25 +135,62 @@ def run_pattern_validation(
     return results
 
 
+@contextmanager
+def _coherence_validator(llm_client, cache_file: Optional[str]) -> Iterator["CoherenceValidator"]:
+    """A CoherenceValidator, with its on-disk cache closed afterwards."""
+    from .coherence_validator import CoherenceResultCache, CoherenceValidator
+
+    disk_cache = CoherenceResultCache(cache_file, COHERENCE_CACHE_TTL) if cache_file else None
+    try:
+        yield CoherenceValidator(llm_client, disk_cache=disk_cache)
+    finally:
+        if disk_cache is not None:
+            disk_cache.close()
+
+
 def run_coherence_validation(
     sections: dict[str, str],
     llm_client,
-    doc_format: str = 'latex',
+    doc_format: Optional[str] = 'latex',
+    *,
+    cache_file: Optional[str] = None,
 ) -> "CoherenceReport":
-    """Run cross-section coherence validation."""
-    from .coherence_validator import CoherenceValidator
+    """
+    Run cross-section coherence validation.
 
-    # Clean sections for coherence analysis (only for LaTeX)
-    if doc_format == 'latex':
-        clean_sections = {
-            name: strip_latex_commands(content)
-            for name, content in sections.items()
-        }
-    else:
-        clean_sections = sections
+    LaTeX sections are stripped first; pass doc_format=None for sections
+    already cleaned with clean_sections(). Safe to call from code that is
+    already running an event loop; use arun_coherence_validation() to send
+    the LLM requests concurrently.
+    """
+    sections = clean_sections(sections, doc_format)
+    with _coherence_validator(llm_client, cache_file) as validator:
+        return validator.validate(sections)
 
-    validator = CoherenceValidator(llm_client)
-    return validator.validate(clean_sections)
+
+async def arun_coherence_validation(
+    sections: dict[str, str],
+    llm_client,
+    doc_format: Optional[str] = 'latex',
+    *,
+    cache_file: Optional[str] = None,
+) -> "CoherenceReport":
+    """
+    Async version of run_coherence_validation().
+
+    Independent LLM passes are sent concurrently. If the client has an
+    aclose() method, it is awaited afterwards on this event loop.
+    """
+    sections = clean_sections(sections, doc_format)
+    try:
+        with _coherence_validator(llm_client, cache_file) as validator:
+            return await validator.avalidate(sections)
+    finally:
+        # The async HTTP client belongs to this event loop; close it
+        # here rather than leave its connections for interpreter exit
+        aclose = getattr(llm_client, "aclose", None)
+        if aclose is not None:
+            await aclose()
 
 
 def print_pattern_results(results: dict[str, ValidationResult]) -> int:
@@ -99,40 +198,53 @@ def print_pattern_results(results: dict[str, ValidationResult]) -> int:
     total_hard = 0
     total_soft = 0
 
-    print("=" * 60)
-    print("PATTERN-BASED VALIDATION RESULTS")
-    print("=" * 60)
+    # Collect all lines and emit them with a single write
+    out = []
+    out.append("=" * 60)
+    out.append("PATTERN-BASED VALIDATION RESULTS")
+    out.append("=" * 60)
 
     for section_name, result in results.items():
         if not result.violations:
             continue
 
-        print(f"\n{section_name}:")
-        print("-" * 40)
+        out.append(f"\n{section_name}:")
+        out.append("-" * 40)
 
         for v in result.violations:
             icon = "\u274c" if v.severity.value == "hard" else "\u26a0\ufe0f"
-            print(f"  {icon} [{v.severity.value.upper()}] {v.type.value}")
-            print(f"     {v.message}")
+            out.append(f"  {icon} [{v.severity.value.upper()}] {v.type.value}")
+            out.append(f"     {v.message}")
             if v.location:
                 loc = v.location[:60] + "..." if len(v.location) > 60 else v.location
-                print(f"     Location: {loc}")
+                out.append(f"     Location: {loc}")
             if v.suggestion:
-                print(f"     Suggestion: {v.suggestion}")
-            print()
+                out.append(f"     Suggestion: {v.suggestion}")
+            out.append("")
 
         total_hard += result.hard_violation_count
         total_soft += result.soft_violation_count
 
-    print("-" * 60)
-    print(f"Total: {total_hard} hard violations, {total_soft} soft violations")
+    out.append("-" * 60)
+    out.append(f"Total: {total_hard} hard violations, {total_soft} soft violations")
 
     if total_hard == 0 and total_soft == 0:
-        print("\u2705 No pattern violations found!")
+        out.append("\u2705 No pattern violations found!")
+
+    sys.stdout.write("\n".join(out) + "\n")
 
     return total_hard + total_soft
 
 
+# Cached coherence results older than this are re-validated
+COHERENCE_CACHE_TTL = 30 * 86400
+
+# Model and connection pool limits for the default Anthropic client
+LLM_MODEL = "claude-sonnet-4-20250514"
+LLM_MAX_CONNECTIONS = 100
+LLM_MAX_KEEPALIVE = 20
+
+
 def get_llm_client():
     """
     Get an LLM client for coherence validation.
@@ -142,20 +254,60 @@ def get_llm_client():
     """
     try:
         import anthropic
+        import httpx
         client = anthropic.Anthropic()
 
         # Wrap the client to match expected interface
         class LLMWrapper:
+            model = LLM_MODEL
+
             def __init__(self, client):
                 self.client = client
+                self._async_client = None
+
+            def chat(self, prompt: str, system: Optional[str] = None) -> str:
+                response = self.client.messages.create(**self._request(prompt, system))
+                return response.content[0].text
+
+            async def achat(self, prompt: str, system: Optional[str] = None) -> str:
+                if self._async_client is None:
+                    # One keep-alive connection pool shared by every
+                    # concurrent request, instead of a handshake per call
+                    self._async_client = anthropic.AsyncAnthropic(
+                        http_client=anthropic.DefaultAsyncHttpxClient(
+                            limits=httpx.Limits(
+                                max_connections=LLM_MAX_CONNECTIONS,
+                                max_keepalive_connections=LLM_MAX_KEEPALIVE,
+                            ),
+                        ),
+                    )
+                response = await self._async_client.messages.create(
+                    **self._request(prompt, system),
+                )
+                return response.content[0].text
 
-            def chat(self, prompt: str) -> str:
-                response = self.client.messages.create(
-                    model="claude-sonnet-4-20250514",
+            async def aclose(self) -> None:
+                """Close the async client; achat() opens a new one if needed."""
+                if self._async_client is not None:
+                    await self._async_client.close()
+                    self._async_client = None
+
+            def _request(self, prompt: str, system: Optional[str]) -> dict:
+                kwargs = {}
+                if system:
+                    # Static instructions are identical across calls; mark
+                    # them cacheable so repeat validations skip their prefill
+                    kwargs["system"] = [{
+                        "type": "text",
+                        "text": system,
+                        "cache_control": {"type": "ephemeral"},
+                    }]
+                return dict(
+                    model=self.model,
                     max_tokens=4096,
                     messages=[{"role": "user", "content": prompt}],
+                    **kwargs,
                 )
-                return response.content[0].text
 
         return LLMWrapper(client)
 
@@ -195,6 +347,11 @@ def main():
         action="store_true",
         help="Only run coherence validation, skip pattern checks",
     )
+    parser.add_argument(
+        "--cache-file",
+        type=str,
+        help="SQLite file for caching coherence LLM results across runs",
+    )
     parser.add_argument(
         "--section",
         type=str,
@@ -238,11 +395,14 @@ def main():
     # Determine paper type
     paper_type = PaperType.QUAL_FORWARD if args.paper_type == "qual_forward" else PaperType.QUANT_FORWARD
 
+    # Strip LaTeX commands once; pattern and coherence checks share the result
+    sections = clean_sections(sections, doc_format)
+
     violation_count = 0
 
     # Run pattern validation (unless coherence-only)
     if not args.coherence_only:
-        results = run_pattern_validation(sections, paper_type, doc_format)
+        results = run_pattern_validation(sections, paper_type, doc_format=None)
         violation_count += print_pattern_results(results)
 
     # Run coherence validation if requested
@@ -253,8 +413,11 @@ def main():
         print("=" * 60 + "\n")
 
         llm_client = get_llm_client()
-        report = run_coherence_validation(sections, llm_client, doc_format)
-        print(report.format_report())
+        report = asyncio.run(arun_coherence_validation(
+            sections, llm_client, doc_format=None, cache_file=args.cache_file,
+        ))
+        report.format_report_to(sys.stdout)
+        sys.stdout.write("\n")
         violation_count += len(report.violations)
 
     # Exit code based on violations
@@ -21,9 +21,33 @@ Usage:
         print(report.format_report())
 """
 
+import hashlib
+import io
+import json
+import math
+import operator
+import sqlite3
+import threading
+import time
+from array import array
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Optional
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Iterator, Optional, Sequence, TextIO, Union
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+try:
+    import msgspec
+    HAS_MSGSPEC = True
+except ImportError:
+    HAS_MSGSPEC = False
 
 from .extractors import (
     ContributionExtractor,
@@ -32,6 +56,272 @@ from .extractors import (
     TheoryAnalysis,
     PreannouncementEvidence,
 )
+from .extractors.base import LRUCache
+from .extractors.contribution_extractor import _has_text
+
+
+# Bump whenever the extraction, pre-announcement or structure prompts
+# change, so cached LLM results from the old wording are never reused.
+PROMPT_VERSION = 2
+
+# Default number of LLM results kept per validator
+CACHE_SIZE = 256
+
+# Cosine similarity above which a previously validated section is treated
+# as the same draft (typo fixes, reordered sentences)
+SEMANTIC_THRESHOLD = 0.87
+
+# Sentence-embedding model used by load_embedder()
+EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+
+
+# Section-name keywords, checked in order; the first keyword found anywhere
+# in the lowercased name decides the canonical section
+_SECTION_KEYWORDS: tuple[tuple[tuple[str, ...], str], ...] = (
+    (("intro",), "introduction"),
+    (("theory", "theoretical", "background", "literature", "lens"), "theory"),
+    (("finding", "result", "empirical"), "findings"),
+    (("discussion", "contribution", "conclusion"), "discussion"),
+    (("method",), "methods"),
+)
+
+
+def _scan_section_keywords(key_lower: str) -> str:
+    for keywords, canonical in _SECTION_KEYWORDS:
+        if any(k in key_lower for k in keywords):
+            return canonical
+    return key_lower
+
+
+# Lowercased section name -> canonical name. Seeded with common headings and
+# extended as new names are seen, so repeat lookups skip the keyword scan.
+_SECTION_ALIASES: dict[str, str] = {
+    name: _scan_section_keywords(name)
+    for name in (
+        "intro", "introduction", "theory", "theoretical background",
+        "background", "literature review", "findings", "results",
+        "discussion", "conclusion", "contributions", "methods",
+    )
+}
+_SECTION_ALIASES_MAX = 1024
+
+
+def _canonical_section(key: str) -> str:
+    """Map a section heading to introduction/theory/findings/discussion/methods."""
+    key_lower = key.lower()
+    canonical = _SECTION_ALIASES.get(key_lower)
+    if canonical is None:
+        canonical = _scan_section_keywords(key_lower)
+        if len(_SECTION_ALIASES) < _SECTION_ALIASES_MAX:
+            _SECTION_ALIASES[key_lower] = canonical
+    return canonical
+
+
+class CoherenceResultCache:
+    """
+    On-disk store of LLM pass results, shared across runs.
+
+    Backed by a small SQLite file keyed by the same digests as the in-memory
+    cache, so re-running the CLI on an already validated paper reads its
+    results from disk instead of calling the LLM.
+
+    Usage:
+        cache = CoherenceResultCache(".style_cache.sqlite", ttl_seconds=30 * 86400)
+        validator = CoherenceValidator(llm_client, disk_cache=cache)
+    """
+
+    def __init__(self, path: Union[str, Path], ttl_seconds: Optional[float] = None):
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.executescript("""
+            PRAGMA journal_mode = WAL;
+            PRAGMA synchronous = NORMAL;
+            CREATE TABLE IF NOT EXISTS results (
+                key TEXT PRIMARY KEY,
+                value BLOB NOT NULL,
+                stored_at REAL NOT NULL
+            );
+        """)
+        if ttl_seconds is not None:
+            with self._conn:
+                self._conn.execute(
+                    "DELETE FROM results WHERE stored_at < ?",
+                    (time.time() - ttl_seconds,),
+                )
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, stored_at FROM results WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        value, stored_at = row
+        if self.ttl_seconds is not None and time.time() - stored_at > self.ttl_seconds:
+            return None
+        return value
+
+    def put(self, key: str, value: bytes) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO results (key, value, stored_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET value = excluded.value, "
+                "stored_at = excluded.stored_at",
+                (key, value, time.time()),
+            )
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM results")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class _SemanticCache:
+    """
+    Nearest-neighbour cache for LLM pass results.
+
+    Stores L2-normalized embeddings of previously validated section text; a
+    lookup returns the stored result whose embedding has cosine similarity
+    of at least `threshold` with the query. Entries are partitioned by
+    `scope` so results are only reused when every non-embedded input (e.g.
+    the contributions fed to the theory pass) is identical.
+
+    Embeddings are stored as int8 with a per-vector scale (a quarter of the
+    memory of float32). With numpy installed, each scope's embeddings are
+    stacked into one matrix so a lookup is a single matrix-vector product.
+    """
+
+    def __init__(self, threshold: float = SEMANTIC_THRESHOLD, maxsize: int = CACHE_SIZE):
+        self.threshold = threshold
+        self.maxsize = maxsize
+        # scope -> [int8 vectors, scales, values, stacked (matrix, scales) or None]
+        self._scopes: dict[str, list] = {}
+        # Scope of every entry in insertion order, for FIFO eviction
+        self._order: deque[str] = deque()
+        self._lock = threading.Lock()
+
+    def get(self, vector: list[float], scope: str = "") -> Any:
+        with self._lock:
+            bucket = self._scopes.get(scope)
+            if not bucket:
+                return None
+            vectors, scales, values, stacked = bucket
+
+            if HAS_NUMPY:
+                if stacked is None:
+                    stacked = bucket[3] = (
+                        np.array(vectors, dtype=np.int8),
+                        np.array(scales, dtype=np.float32),
+                    )
+                matrix, matrix_scales = stacked
+                scores = (matrix @ np.asarray(vector, dtype=np.float32)) * matrix_scales
+                best = int(np.argmax(scores))
+                score = float(scores[best])
+            else:
+                scores = [
+                    sum(map(operator.mul, cached, vector)) * scale
+                    for cached, scale in zip(vectors, scales)
+                ]
+                score = max(scores)
+                best = scores.index(score)
+
+            return values[best] if score >= self.threshold else None
+
+    def put(self, vector: list[float], value: Any, scope: str = "") -> None:
+        if self.maxsize <= 0:
+            return
+        quantized, scale = _quantize(vector)
+        with self._lock:
+            bucket = self._scopes.setdefault(scope, [[], [], [], None])
+            bucket[0].append(quantized)
+            bucket[1].append(scale)
+            bucket[2].append(value)
+            bucket[3] = None
+            self._order.append(scope)
+
+            if len(self._order) > self.maxsize:
+                oldest_scope = self._order.popleft()
+                oldest = self._scopes[oldest_scope]
+                del oldest[0][0], oldest[1][0], oldest[2][0]
+                oldest[3] = None
+                if not oldest[2]:
+                    del self._scopes[oldest_scope]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._scopes.clear()
+            self._order.clear()
+
+
+def _encode_result(stage: str, result: Any) -> bytes:
+    """
+    Serialize a pass result for the caches.
+
+    Cached results are stored as bytes and decoded on every hit, so callers
+    can't mutate a cached result through a report they were handed.
+    """
+    if stage == "extract":
+        data = [c.to_dict() for c in result]
+    else:
+        data = result.to_dict() if result is not None else None
+    if HAS_MSGSPEC:
+        return msgspec.msgpack.encode(data)
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def _decode_result(stage: str, blob: bytes) -> Any:
+    data = msgspec.msgpack.decode(blob) if HAS_MSGSPEC else json.loads(blob)
+    if stage == "extract":
+        return tuple(ExtractedContribution.from_dict(d, section=d["section_source"]) for d in data)
+    return TheoryAnalysis.from_dict(data) if data is not None else None
+
+
+def _quantize(vector: list[float]) -> tuple[array, float]:
+    """Symmetric int8 quantization: vector ~= quantized * scale."""
+    peak = max(map(abs, vector), default=0.0)
+    if not peak:
+        return array("b", bytes(len(vector))), 0.0
+    factor = 127 / peak
+    return array("b", [round(x * factor) for x in vector]), peak / 127
+
+
+def _normalize(vector: Sequence[float]) -> list[float]:
+    """Scale a vector to unit length so a dot product is cosine similarity."""
+    values = [float(x) for x in vector]
+    norm = math.sqrt(sum(x * x for x in values))
+    return [x / norm for x in values] if norm else values
+
+
+def load_embedder(model_name: str = EMBEDDING_MODEL) -> Callable[[str], list[float]]:
+    """
+    Build a section embedder for CoherenceValidator's semantic cache.
+
+    Sections are embedded paragraph by paragraph and mean-pooled, since the
+    model only reads the first ~256 tokens of each input.
+
+    Requires the sentence-transformers package.
+    """
+    try:
+        from sentence_transformers import SentenceTransformer
+    except ImportError:
+        raise ImportError(
+            "sentence-transformers is required for the semantic cache. "
+            "Install with: pip install sentence-transformers"
+        )
+
+    model = SentenceTransformer(model_name)
+
+    def embed(text: str) -> list[float]:
+        paragraphs = [p for p in text.split("\n\n") if p.strip()] or [text]
+        vectors = model.encode(paragraphs, normalize_embeddings=True)
+        return [sum(column) / len(vectors) for column in zip(*vectors)]
+
+    return embed
 
 
 class CoherenceViolationType(Enum):
@@ -58,20 +348,31 @@ class CoherenceViolationType(Enum):
     CONFIRMATORY_STRUCTURE = "confirmatory_structure"
 
 
-@dataclass
+# Violation severities
+SEVERITY_CRITICAL = "critical"
+SEVERITY_WARNING = "warning"
+SEVERITY_INFO = "info"
+
+# Report icons
+ICON_CRITICAL = "\u274c"
+ICON_WARNING = "\u26a0\ufe0f"
+ICON_OK = "\u2705"
+
+
+@dataclass(slots=True)
 class CoherenceViolation:
     """A cross-section coherence violation."""
     type: CoherenceViolationType
-    severity: str  # "critical", "warning", "info"
+    severity: str  # SEVERITY_CRITICAL, SEVERITY_WARNING, SEVERITY_INFO
     message: str
     evidence: Optional[str] = None
     suggestion: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CoherenceReport:
     """Report from cross-section coherence validation."""
-    contributions: list[ExtractedContribution] = field(default_factory=list)
+    contributions: Sequence[ExtractedContribution] = ()
     theory_analysis: Optional[TheoryAnalysis] = None
     violations: list[CoherenceViolation] = field(default_factory=list)
     structure_rating: int = 0  # 1-5 scale
@@ -82,11 +383,16 @@ class CoherenceReport:
 
     @property
     def critical_count(self) -> int:
-        return sum(1 for v in self.violations if v.severity == "critical")
+        return self._count_severity(SEVERITY_CRITICAL)
 
     @property
     def warning_count(self) -> int:
-        return sum(1 for v in self.violations if v.severity == "warning")
+        return self._count_severity(SEVERITY_WARNING)
+
+    def _count_severity(self, severity: str) -> int:
+        # Counted on each access: reports hold a handful of violations, and
+        # callers may edit the list in place
+        return sum(1 for v in self.violations if v.severity == severity)
 
     @property
     def is_properly_inductive(self) -> bool:
@@ -94,83 +400,113 @@ class CoherenceReport:
 
     def format_report(self) -> str:
         """Format the report for display."""
-        lines = []
-        lines.append("=" * 60)
-        lines.append("CROSS-SECTION COHERENCE ANALYSIS")
-        lines.append("=" * 60)
-
-        # Contributions summary
-        lines.append("\nEXTRACTED CONTRIBUTIONS (from Findings/Discussion):")
-        if self.contributions:
-            for i, c in enumerate(self.contributions, 1):
-                concept = f" ['{c.named_concept_if_any}']" if c.named_concept_if_any else ""
-                lines.append(f"  {i}. {c.claim}{concept}")
+        buf = io.StringIO()
+        self.format_report_to(buf)
+        return buf.getvalue()
+
+    def format_report_to(self, fp: TextIO) -> None:
+        """Write the formatted report to a text stream, block by block."""
+        w = fp.write
+        w(_REPORT_HEADER)
+        for block in (
+            self._contribution_lines(),
+            self._theory_lines(),
+            self._violation_lines(),
+        ):
+            for line in block:
+                w("\n")
+                w(line)
+        w(_REPORT_RATING.format(
+            rating=self.structure_rating,
+            rating_desc=RATING_DESCRIPTIONS.get(self.structure_rating, "Unknown"),
+        ))
+        for line in self._assessment_lines():
+            w("\n")
+            w(line)
+        w(_REPORT_FOOTER)
+
+    def _contribution_lines(self) -> Iterator[str]:
+        if not self.contributions:
+            yield "  (No contributions extracted)"
+        for i, c in enumerate(self.contributions, 1):
+            concept = f" ['{c.named_concept_if_any}']" if c.named_concept_if_any else ""
+            yield f"  {i}. {c.claim}{concept}"
+
+    def _theory_lines(self) -> Iterator[str]:
+        analysis = self.theory_analysis
+        if not analysis:
+            return
+        yield "\nTHEORY SECTION ANALYSIS:"
+
+        # Gap statement
+        if analysis.gap_statement:
+            yield "\n  Gap Statement: Present"
+            yield f"    \"{analysis.gap_statement[:200]}...\""
         else:
-            lines.append("  (No contributions extracted)")
-
-        # Theory analysis
-        if self.theory_analysis:
-            lines.append("\nTHEORY SECTION ANALYSIS:")
-
-            # Gap statement
-            if self.theory_analysis.gap_statement:
-                lines.append(f"\n  Gap Statement: Present")
-                lines.append(f"    \"{self.theory_analysis.gap_statement[:200]}...\"")
-            else:
-                lines.append(f"\n  Gap Statement: MISSING")
-
-            # Research questions
-            if self.theory_analysis.research_questions:
-                lines.append(f"\n  Research Questions:")
-                for rq in self.theory_analysis.research_questions:
-                    lines.append(f"    - {rq}")
-
-            # Pre-announcements
-            if self.theory_analysis.preannouncements:
-                lines.append(f"\n  PRE-ANNOUNCEMENTS DETECTED ({len(self.theory_analysis.preannouncements)}):")
-                for pa in self.theory_analysis.preannouncements:
-                    lines.append(f"\n  \u26a0\ufe0f  {pa.severity.upper()} SEVERITY")
-                    lines.append(f"      Finding: \"{pa.finding_claim[:100]}...\"")
-                    lines.append(f"      Theory text: \"{pa.theory_text[:150]}...\"")
-                    lines.append(f"      Issue: {pa.similarity_explanation}")
-
-        # Violations
-        if self.violations:
-            lines.append("\n" + "-" * 60)
-            lines.append("VIOLATIONS:")
-            for v in self.violations:
-                icon = "\u274c" if v.severity == "critical" else "\u26a0\ufe0f"
-                lines.append(f"\n{icon} [{v.severity.upper()}] {v.type.value}")
-                lines.append(f"   {v.message}")
-                if v.evidence:
-                    lines.append(f"   Evidence: \"{v.evidence[:150]}...\"")
-                if v.suggestion:
-                    lines.append(f"   Suggestion: {v.suggestion}")
-
-        # Overall assessment
-        lines.append("\n" + "-" * 60)
-        lines.append("OVERALL STRUCTURE RATING:")
-        rating_desc = {
-            5: "Pure inductive (discovery)",
-            4: "Mostly inductive",
-            3: "Mixed (some preview)",
-            2: "Mostly deductive (confirmatory)",
-            1: "Pure deductive (confirmation)",
-        }
-        desc = rating_desc.get(self.structure_rating, "Unknown")
-        lines.append(f"  {self.structure_rating}/5 - {desc}")
-
+            yield "\n  Gap Statement: MISSING"
+
+        # Research questions
+        if analysis.research_questions:
+            yield "\n  Research Questions:"
+            for rq in analysis.research_questions:
+                yield f"    - {rq}"
+
+        # Pre-announcements
+        if analysis.preannouncements:
+            yield f"\n  PRE-ANNOUNCEMENTS DETECTED ({len(analysis.preannouncements)}):"
+            for pa in analysis.preannouncements:
+                yield f"\n  {ICON_WARNING}  {pa.severity.upper()} SEVERITY"
+                yield f"      Finding: \"{pa.finding_claim[:100]}...\""
+                yield f"      Theory text: \"{pa.theory_text[:150]}...\""
+                yield f"      Issue: {pa.similarity_explanation}"
+
+    def _violation_lines(self) -> Iterator[str]:
+        if not self.violations:
+            return
+        yield "\n" + "-" * 60
+        yield "VIOLATIONS:"
+        for v in self.violations:
+            icon = ICON_CRITICAL if v.severity == SEVERITY_CRITICAL else ICON_WARNING
+            yield f"\n{icon} [{v.severity.upper()}] {v.type.value}"
+            yield f"   {v.message}"
+            if v.evidence:
+                yield f"   Evidence: \"{v.evidence[:150]}...\""
+            if v.suggestion:
+                yield f"   Suggestion: {v.suggestion}"
+
+    def _assessment_lines(self) -> Iterator[str]:
         if self.is_properly_inductive:
-            lines.append("\n\u2705 Paper has proper inductive structure.")
-        else:
-            lines.append("\n\u274c Paper needs structural revision for inductive framing.")
-            if self.theory_analysis and self.theory_analysis.preannouncements:
-                lines.append("   Key issue: Theory section pre-announces findings.")
-                lines.append("   Recommendation: Rewrite theory to end with genuine")
-                lines.append("   questions, not previewed answers.")
-
-        lines.append("\n" + "=" * 60)
-        return "\n".join(lines)
+            yield f"\n{ICON_OK} Paper has proper inductive structure."
+            return
+        yield f"\n{ICON_CRITICAL} Paper needs structural revision for inductive framing."
+        if self.theory_analysis and self.theory_analysis.preannouncements:
+            yield "   Key issue: Theory section pre-announces findings."
+            yield "   Recommendation: Rewrite theory to end with genuine"
+            yield "   questions, not previewed answers."
+
+
+RATING_DESCRIPTIONS = {
+    5: "Pure inductive (discovery)",
+    4: "Mostly inductive",
+    3: "Mixed (some preview)",
+    2: "Mostly deductive (confirmatory)",
+    1: "Pure deductive (confirmation)",
+}
+
+# Fixed parts of CoherenceReport.format_report(); every variable line is
+# written preceded by a newline
+_REPORT_HEADER = (
+    "=" * 60 + "\n"
+    "CROSS-SECTION COHERENCE ANALYSIS\n"
+    + "=" * 60 + "\n"
+    "\nEXTRACTED CONTRIBUTIONS (from Findings/Discussion):"
+)
+_REPORT_RATING = (
+    "\n\n" + "-" * 60 + "\n"
+    "OVERALL STRUCTURE RATING:\n"
+    "  {rating}/5 - {rating_desc}"
+)
+_REPORT_FOOTER = "\n\n" + "=" * 60
 
 
 class CoherenceValidator:
@@ -182,16 +518,44 @@ class CoherenceValidator:
     a puzzle and gap WITHOUT pre-announcing those findings.
     """
 
-    def __init__(self, llm_client: Any):
+    def __init__(
+        self,
+        llm_client: Any,
+        cache_size: int = CACHE_SIZE,
+        ttl_seconds: Optional[float] = None,
+        embedder: Optional[Callable[[str], Sequence[float]]] = None,
+        semantic_threshold: float = SEMANTIC_THRESHOLD,
+        disk_cache: Optional[CoherenceResultCache] = None,
+    ):
         """
         Initialize with an LLM client.
 
         Args:
             llm_client: Any LLM client with a chat()/generate() method.
+            cache_size: Number of LLM pass results to keep (0 disables caching)
+            ttl_seconds: Expire cached results after this many seconds (None = never)
+            embedder: Optional text -> vector function (see load_embedder()).
+                     Enables reuse of results for near-duplicate drafts.
+            semantic_threshold: Minimum cosine similarity for a semantic cache hit
+            disk_cache: Optional persistent store consulted after the in-memory
+                       cache, so results survive across runs
         """
         self.llm = llm_client
-        self.contribution_extractor = ContributionExtractor(llm_client)
-        self.theory_analyzer = TheoryAnalyzer(llm_client)
+        # Whole pass results are cached here (exact, on-disk and semantic),
+        # so the components' own response caches are switched off
+        self.contribution_extractor = ContributionExtractor(llm_client, cache_size=0)
+        self.theory_analyzer = TheoryAnalyzer(llm_client, cache_size=0)
+        # Exact-match results keyed by digests of each pass's inputs
+        self.cache = LRUCache(cache_size, ttl_seconds)
+        self.disk_cache = disk_cache
+        self._model = str(getattr(llm_client, "model", "") or "")
+
+        # One semantic cache per pass so their results never cross
+        self.embedder = embedder
+        self._semantic = {
+            stage: _SemanticCache(semantic_threshold, cache_size)
+            for stage in ("extract", "analyze")
+        }
 
     def validate(
         self,
@@ -210,20 +574,152 @@ class CoherenceValidator:
         # Normalize section names
         sections = self._normalize_sections(paper_sections)
 
+        findings = sections.get("findings", "")
+        discussion = sections.get("discussion", "")
+        intro = sections.get("introduction", "")
+        theory = sections.get("theory", "")
+
         # Step 1: Extract what the paper claims as contributions
-        contributions = self.contribution_extractor.extract(
-            findings=sections.get("findings", ""),
-            discussion=sections.get("discussion", ""),
-        )
+        contributions = ()
+        if _has_text(findings, discussion):
+            contributions = self._cached(
+                "extract", (findings, discussion),
+                lambda: self.contribution_extractor.extract(
+                    findings=findings,
+                    discussion=discussion,
+                ),
+            )
+
+        # Step 2: Analyze theory section structure (nothing to analyze
+        # without an introduction or theory section)
+        theory_analysis = None
+        if _has_text(intro, theory):
+            theory_analysis = self._cached(
+                "analyze", (intro, theory),
+                lambda: self.theory_analyzer.analyze(
+                    intro=intro,
+                    theory=theory,
+                    contributions=contributions,
+                ),
+                scope=self._contributions_scope(contributions),
+            )
 
-        # Step 2: Analyze theory section structure
-        theory_analysis = self.theory_analyzer.analyze(
-            intro=sections.get("introduction", ""),
-            theory=sections.get("theory", ""),
-            contributions=contributions,
+        # Step 3: Check for structural coherence violations
+        return self._build_report(contributions, theory_analysis)
+
+    async def avalidate(
+        self,
+        paper_sections: dict[str, str],
+    ) -> CoherenceReport:
+        """
+        Async version of validate().
+
+        Both theory prompts read the extracted contributions, so extraction
+        still runs first; the pre-announcement and structure checks are then
+        sent concurrently. Clients with an async achat() are awaited
+        directly, others run in worker threads.
+
+        Args:
+            paper_sections: Dictionary mapping section names to text
+
+        Returns:
+            CoherenceReport with analysis and violations
+        """
+        sections = self._normalize_sections(paper_sections)
+
+        findings = sections.get("findings", "")
+        discussion = sections.get("discussion", "")
+        intro = sections.get("introduction", "")
+        theory = sections.get("theory", "")
+
+        contributions = ()
+        if _has_text(findings, discussion):
+            contributions = await self._acached(
+                "extract", (findings, discussion),
+                lambda: self.contribution_extractor.aextract(
+                    findings=findings,
+                    discussion=discussion,
+                ),
+            )
+
+        theory_analysis = None
+        if _has_text(intro, theory):
+            theory_analysis = await self._acached(
+                "analyze", (intro, theory),
+                lambda: self.theory_analyzer.aanalyze(
+                    intro=intro,
+                    theory=theory,
+                    contributions=contributions,
+                ),
+                scope=self._contributions_scope(contributions),
+            )
+
+        return self._build_report(contributions, theory_analysis)
+
+    def validate_batch(
+        self,
+        papers: list[dict[str, str]],
+    ) -> list[CoherenceReport]:
+        """
+        Validate several papers, sharing LLM requests between them.
+
+        Papers already in the cache are served from it; the rest have their
+        extraction prompts packed together, then their theory prompts.
+
+        Args:
+            papers: One section-name -> text dictionary per paper
+
+        Returns:
+            One CoherenceReport per paper, in input order
+        """
+        all_sections = [self._normalize_sections(p) for p in papers]
+
+        # Step 1: contributions, batching the cache misses
+        contributions: list[Any] = []
+        misses = []
+        for i, sections in enumerate(all_sections):
+            texts = (sections.get("findings", ""), sections.get("discussion", ""))
+            if not _has_text(*texts):
+                contributions.append(())
+                continue
+            result, key, vector = self._cache_lookup("extract", texts, "")
+            contributions.append(result)
+            if result is None:
+                misses.append((i, texts, key, vector))
+
+        extracted = self.contribution_extractor.extract_batch([texts for _, texts, _, _ in misses])
+        for (i, _, key, vector), result in zip(misses, extracted):
+            self._cache_store("extract", key, vector, result, "")
+            contributions[i] = result
+
+        # Step 2: theory analysis for each paper's own contributions
+        analyses: list[Any] = []
+        misses = []
+        for i, sections in enumerate(all_sections):
+            texts = (sections.get("introduction", ""), sections.get("theory", ""))
+            if not _has_text(*texts):
+                analyses.append(None)
+                continue
+            scope = self._contributions_scope(contributions[i])
+            result, key, vector = self._cache_lookup("analyze", texts, scope)
+            analyses.append(result)
+            if result is None:
+                misses.append((i, texts, scope, key, vector))
+
+        analyzed = self.theory_analyzer.analyze_batch(
+            [(intro, theory, contributions[i]) for i, (intro, theory), _, _, _ in misses]
         )
+        for (i, _, scope, key, vector), result in zip(misses, analyzed):
+            self._cache_store("analyze", key, vector, result, scope)
+            analyses[i] = result
 
-        # Step 3: Check for structural coherence violations
+        return [self._build_report(c, a) for c, a in zip(contributions, analyses)]
+
+    def _build_report(
+        self,
+        contributions: Sequence[ExtractedContribution],
+        theory_analysis: Optional[TheoryAnalysis],
+    ) -> CoherenceReport:
         violations = self._check_coherence(contributions, theory_analysis)
 
         return CoherenceReport(
@@ -233,42 +729,117 @@ class CoherenceValidator:
             structure_rating=theory_analysis.structure_rating if theory_analysis else 0,
         )
 
+    @staticmethod
+    def _contributions_scope(contributions: Sequence[ExtractedContribution]) -> str:
+        """The theory pass may only reuse results for identical contributions."""
+        return json.dumps([c.to_dict() for c in contributions], sort_keys=True)
+
+    def _cached(
+        self,
+        stage: str,
+        texts: tuple[str, ...],
+        compute: Callable[[], Any],
+        scope: str = "",
+    ) -> Any:
+        """
+        Return a pass result from the exact or semantic cache, or compute it.
+
+        `texts` are the section texts the pass reads; `scope` holds any other
+        input that must match exactly for a cached result to be reused.
+        """
+        result, key, vector = self._cache_lookup(stage, texts, scope)
+        if result is None:
+            result = compute()
+            self._cache_store(stage, key, vector, result, scope)
+        return result
+
+    async def _acached(
+        self,
+        stage: str,
+        texts: tuple[str, ...],
+        compute: Callable[[], Awaitable[Any]],
+        scope: str = "",
+    ) -> Any:
+        """Async counterpart of _cached(); `compute` returns an awaitable."""
+        result, key, vector = self._cache_lookup(stage, texts, scope)
+        if result is None:
+            result = await compute()
+            self._cache_store(stage, key, vector, result, scope)
+        return result
+
+    def _cache_lookup(
+        self,
+        stage: str,
+        texts: tuple[str, ...],
+        scope: str,
+    ) -> tuple[Any, str, Optional[list[float]]]:
+        """Check the exact then the semantic cache; returns (result, key, vector)."""
+        key = self._cache_key(stage, scope, *texts)
+        blob = self.cache.get(key)
+        if blob is None and self.disk_cache is not None:
+            blob = self.disk_cache.get(key)
+            if blob is not None:
+                self.cache.put(key, blob)
+        if blob is not None:
+            return _decode_result(stage, blob), key, None
+
+        vector = None
+        if self.embedder is not None:
+            vector = _normalize(self.embedder("\n\n".join(texts)))
+            blob = self._semantic[stage].get(vector, scope)
+            if blob is not None:
+                self.cache.put(key, blob)
+                return _decode_result(stage, blob), key, vector
+        return None, key, vector
+
+    def _cache_store(
+        self,
+        stage: str,
+        key: str,
+        vector: Optional[list[float]],
+        result: Any,
+        scope: str,
+    ) -> None:
+        # An empty extraction may be a parse failure, and an unparsed
+        # analysis is all defaults; don't pin either in the cache
+        if not result or (stage == "analyze" and not result.parsed):
+            return
+        blob = _encode_result(stage, result)
+        self.cache.put(key, blob)
+        if self.disk_cache is not None:
+            self.disk_cache.put(key, blob)
+        if vector is not None:
+            self._semantic[stage].put(vector, blob, scope)
+
+    def _cache_key(self, stage: str, *parts: str) -> str:
+        """Digest of the prompt version, model, pass name and its inputs."""
+        h = hashlib.blake2b(digest_size=20)
+        for part in (str(PROMPT_VERSION), self._model, stage, *parts):
+            h.update(part.encode("utf-8"))
+            h.update(b"\x00")
+        return h.hexdigest()
+
     def _normalize_sections(self, sections: dict[str, str]) -> dict[str, str]:
         """Normalize section name variations."""
-        normalized = {}
-
-        for key, value in sections.items():
-            key_lower = key.lower()
-
-            if any(k in key_lower for k in ["intro", "introduction"]):
-                normalized["introduction"] = value
-            elif any(k in key_lower for k in ["theory", "theoretical", "background", "literature", "lens"]):
-                normalized["theory"] = value
-            elif any(k in key_lower for k in ["finding", "result", "empirical"]):
-                normalized["findings"] = value
-            elif any(k in key_lower for k in ["discussion", "contribution", "conclusion"]):
-                normalized["discussion"] = value
-            elif "method" in key_lower:
-                normalized["methods"] = value
-            else:
-                normalized[key_lower] = value
-
-        return normalized
+        return {_canonical_section(key): value for key, value in sections.items()}
 
     def _check_coherence(
         self,
-        contributions: list[ExtractedContribution],
+        contributions: Sequence[ExtractedContribution],
         theory_analysis: Optional[TheoryAnalysis],
     ) -> list[CoherenceViolation]:
         """Generate violations based on extracted data and analysis."""
         violations = []
 
-        if not theory_analysis:
+        # Without a parsed analysis the defaults would read as violations
+        if not theory_analysis or not theory_analysis.parsed:
             return violations
 
+        preannouncements = theory_analysis.preannouncements
+
         # Check for pre-announcements (most critical)
-        for pa in theory_analysis.preannouncements:
-            severity = "critical" if pa.severity == "high" else "warning"
+        for pa in preannouncements:
+            severity = SEVERITY_CRITICAL if pa.severity == "high" else SEVERITY_WARNING
             violations.append(CoherenceViolation(
                 type=CoherenceViolationType.FINDINGS_PREANNOUNCED,
                 severity=severity,
@@ -283,14 +854,22 @@ class CoherenceValidator:
         mechanism_contributions = [
             c for c in contributions
             if c.mechanism_if_any
-        ]
+        ] if preannouncements else []
+        if mechanism_contributions:
+            pa_texts_lower = [pa.theory_text.lower() for pa in preannouncements]
+            # All excerpts in one haystack: a single C-level scan per mechanism
+            # rules out the common case of a mechanism appearing in none of them
+            all_pa_text = "\x00".join(pa_texts_lower)
         for mc in mechanism_contributions:
+            mechanism_lower = mc.mechanism_if_any.lower()
+            if mechanism_lower not in all_pa_text:
+                continue
             # Check if any preannouncement relates to a mechanism
-            for pa in theory_analysis.preannouncements:
-                if mc.mechanism_if_any and mc.mechanism_if_any.lower() in pa.theory_text.lower():
+            for pa, pa_text_lower in zip(preannouncements, pa_texts_lower):
+                if mechanism_lower in pa_text_lower:
                     violations.append(CoherenceViolation(
                         type=CoherenceViolationType.MECHANISM_PREANNOUNCED,
-                        severity="critical",
+                        severity=SEVERITY_CRITICAL,
                         message=f"Mechanism '{mc.mechanism_if_any[:50]}...' explained in "
                                f"theory before findings reveal it.",
                         evidence=pa.theory_text,
@@ -303,7 +882,7 @@ class CoherenceValidator:
         if not theory_analysis.gap_statement:
             violations.append(CoherenceViolation(
                 type=CoherenceViolationType.MISSING_GAP_STATEMENT,
-                severity="warning",
+                severity=SEVERITY_WARNING,
                 message="No clear gap statement identified in theory section.",
                 suggestion="Theory should explicitly identify what prior work "
                           "hasn't explained. E.g., 'Prior work has focused on X, "
@@ -315,7 +894,7 @@ class CoherenceValidator:
         if theory_analysis.structure_rating <= 2:
             violations.append(CoherenceViolation(
                 type=CoherenceViolationType.CONFIRMATORY_STRUCTURE,
-                severity="critical",
+                severity=SEVERITY_CRITICAL,
                 message=f"Paper has confirmatory (deductive) structure "
                        f"(rating: {theory_analysis.structure_rating}/5).",
                 suggestion="Restructure so theory poses QUESTIONS and findings "
@@ -325,7 +904,7 @@ class CoherenceValidator:
         elif theory_analysis.structure_rating == 3:
             violations.append(CoherenceViolation(
                 type=CoherenceViolationType.CONFIRMATORY_STRUCTURE,
-                severity="warning",
+                severity=SEVERITY_WARNING,
                 message=f"Paper has mixed inductive/deductive structure "
                        f"(rating: {theory_analysis.structure_rating}/5).",
                 suggestion="Review theory section for any text that previews "
@@ -351,3 +930,33 @@ def validate_paper_coherence(
     """
     validator = CoherenceValidator(llm_client)
     return validator.validate(paper_sections)
+
+
+def validate_corpus(
+    papers: list[dict[str, str]],
+    llm_client: Any,
+    max_workers: int = 16,
+) -> list[CoherenceReport]:
+    """
+    Validate many papers concurrently.
+
+    Each paper's LLM calls spend most of their time waiting on the network,
+    so papers are validated on a thread pool sharing one validator (and its
+    caches). Keep max_workers within the provider's concurrent-request limit
+    (e.g. the Anthropic rate limit for the API key, or OLLAMA_NUM_PARALLEL
+    for a local Ollama server).
+
+    Args:
+        papers: One section-name -> text dictionary per paper
+        llm_client: Thread-safe LLM client for semantic analysis
+        max_workers: Maximum number of papers validated at once
+
+    Returns:
+        One CoherenceReport per paper, in input order
+    """
+    validator = CoherenceValidator(llm_client)
+    if max_workers <= 1 or len(papers) <= 1:
+        return [validator.validate(p) for p in papers]
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(papers))) as executor:
+        return list(executor.map(validator.validate, papers))
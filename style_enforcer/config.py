@@ -11,7 +11,8 @@ Defines per-section rules, constraints, and budgets for:
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional
+from types import MappingProxyType
+from typing import Mapping, Optional
 
 
 class HookType(Enum):
@@ -27,9 +28,14 @@ class PaperType(Enum):
     QUANT_FORWARD = "quant_forward"    # Large datasets, quant as figure
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SectionConfig:
-    """Configuration for a single manuscript section."""
+    """Configuration for a single manuscript section.
+
+    Immutable: the default section configs are shared by every
+    ManuscriptConfig built without explicit sections. Use
+    dataclasses.replace() to derive a variant.
+    """
 
     name: str
     min_words: int = 0
@@ -39,8 +45,8 @@ class SectionConfig:
     figure_budget: tuple[int, int] = (0, 5)
 
     # Structural requirements
-    required_elements: list[str] = field(default_factory=list)
-    prohibited_elements: list[str] = field(default_factory=list)
+    required_elements: tuple[str, ...] = ()
+    prohibited_elements: tuple[str, ...] = ()
 
     # Special rules
     allow_cold_open: bool = False
@@ -52,7 +58,7 @@ class SectionConfig:
     require_topic_sentence_claims: bool = True   # Paragraph opens with claim, not citation
     require_clincher_sentences: bool = False      # Paragraph ends with restatement/bridge
     require_lexical_transitions: bool = False     # Cross-paragraph concept threading
-    citation_function_rules: list[str] = field(default_factory=list)  # Expected citation functions
+    citation_function_rules: tuple[str, ...] = ()  # Expected citation functions
 
     # Exemplar guidance
     exemplar_key: Optional[str] = None  # Key into ExemplarDB
@@ -61,9 +67,12 @@ class SectionConfig:
         # Enforce: contribution format can never be "list"
         if self.contribution_format != "narrative_only":
             raise ValueError("contribution_format must be 'narrative_only'")
+        # Element lists are given as lists; store them as tuples
+        for name in ("required_elements", "prohibited_elements", "citation_function_rules"):
+            object.__setattr__(self, name, tuple(getattr(self, name)))
 
 
-@dataclass
+@dataclass(slots=True)
 class ManuscriptConfig:
     """Configuration for entire manuscript."""
 
@@ -80,13 +89,21 @@ class ManuscriptConfig:
     total_figure_budget: tuple[int, int] = (2, 4)
 
     # Section configurations
-    sections: dict[str, SectionConfig] = field(default_factory=dict)
+    # Configs without explicit sections share the read-only defaults
+    sections: Mapping[str, SectionConfig] = field(default_factory=dict)
+
+    # Normalized lookup name -> key in `sections`, filled in by get_section()
+    _section_index: dict[str, str] = field(
+        default_factory=dict, init=False, repr=False, compare=False,
+    )
 
     def __post_init__(self):
         if not self.sections:
-            self.sections = self._default_sections()
+            self.sections = _DEFAULT_QUANT_SECTIONS
+        self._section_index = {key: key for key in self.sections}
 
-    def _default_sections(self) -> dict[str, SectionConfig]:
+    @staticmethod
+    def _default_sections() -> dict[str, SectionConfig]:
         """Default section configurations for quant-forward paper."""
         return {
             "abstract": SectionConfig(
@@ -207,17 +224,26 @@ class ManuscriptConfig:
         """Get configuration for a section."""
         # Normalize name
         key = section_name.lower().replace(" ", "_")
+        resolved = self._section_index.get(key)
+        if resolved is not None and resolved in self.sections:
+            return self.sections[resolved]
         if key in self.sections:
+            self._section_index[key] = key
             return self.sections[key]
 
-        # Try partial match
+        # Try partial match, remembering the result for next time
         for k, v in self.sections.items():
             if key in k or k in key:
+                self._section_index[key] = k
                 return v
 
         raise KeyError(f"Unknown section: {section_name}")
 
 
+# Built once at import rather than per ManuscriptConfig
+_DEFAULT_QUANT_SECTIONS = MappingProxyType(ManuscriptConfig._default_sections())
+
+
 # Preset configurations for common paper types
 
 QUANT_FORWARD_ORGSCI = ManuscriptConfig(
@@ -10,12 +10,35 @@ This module provides tools to:
 
 import os
 import re
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import Optional
 from enum import Enum
 
 
+# Number of recent scan results kept in memory
+SCAN_CACHE_SIZE = 32
+
+# Scan results keyed by (inventory class, resolved root, tree fingerprint),
+# used only by scan(..., use_cache=True) for callers that rescan the same
+# directory repeatedly. Each caller gets its own copy of a cached result.
+# The fingerprint only covers the root and its immediate entries (see
+# DataInventory._scan_cache_key); call clear_scan_cache() after changing
+# deeper subdirectories.
+_scan_cache: OrderedDict[tuple, "InventoryResult"] = OrderedDict()
+_scan_cache_lock = threading.Lock()
+
+
+def clear_scan_cache() -> None:
+    """Drop all cached scan results."""
+    with _scan_cache_lock:
+        _scan_cache.clear()
+
+
 class DataType(Enum):
     """Types of data sources."""
     SPREADSHEET = "spreadsheet"  # .xlsx, .csv
@@ -26,14 +49,14 @@ class DataType(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(slots=True)
 class DataFile:
     """Metadata about a data file."""
     path: Path
     name: str
     data_type: DataType
     extension: str
-    size_bytes: int
+    size_bytes: int  # -1 when the scan skipped stat()
     columns: list[str] = field(default_factory=list)  # For tabular data
     variables: list[str] = field(default_factory=list)  # Key variables mentioned
     notes: str = ""
@@ -41,10 +64,10 @@ class DataFile:
     @property
     def available(self) -> bool:
         """Whether the file actually exists and is readable."""
-        return self.path.exists() and self.size_bytes > 0
+        return self.path.exists() and self.size_bytes != 0
 
 
-@dataclass
+@dataclass(slots=True)
 class DataClaim:
     """A claim in the manuscript that references data."""
     text: str
@@ -55,7 +78,7 @@ class DataClaim:
     notes: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class InventoryResult:
     """Result of scanning a data directory."""
     files: list[DataFile]
@@ -64,6 +87,14 @@ class InventoryResult:
     interview_files: int
     missing_common: list[str]  # Common data types we don't have
 
+    @property
+    def by_type(self) -> dict[DataType, list[DataFile]]:
+        """Files grouped by type, built from `files` on each access."""
+        by_type = {}
+        for f in self.files:
+            by_type.setdefault(f.data_type, []).append(f)
+        return by_type
+
     def has_data_type(self, data_type: DataType) -> bool:
         """Check if we have any files of this type."""
         return any(f.data_type == data_type for f in self.files)
@@ -72,6 +103,20 @@ class InventoryResult:
         """Get all files of a specific type."""
         return [f for f in self.files if f.data_type == data_type]
 
+    def copy(self) -> "InventoryResult":
+        """A copy whose file records and lists can be changed independently."""
+        files = [
+            replace(f, columns=list(f.columns), variables=list(f.variables))
+            for f in self.files
+        ]
+        return InventoryResult(
+            files=files,
+            total_files=self.total_files,
+            tabular_files=self.tabular_files,
+            interview_files=self.interview_files,
+            missing_common=list(self.missing_common),
+        )
+
 
 class DataInventory:
     """
@@ -124,16 +169,62 @@ class DataInventory:
         'notes', 'memo', 'ethnograph',
     ]
 
-    def __init__(self):
-        """Initialize the inventory scanner."""
+    # Phrases that mark a claim as a survey statistic
+    SURVEY_INDICATORS = [
+        'survey', 'respondent', 'response rate', 'likert',
+        'weekly measure', 'scale', 'questionnaire',
+    ]
+
+    # Patterns that mark a claim as a worker count or sample size
+    COUNT_CLAIM_PATTERNS = [
+        r'\d+\s*workers?', r'\d+\s*employees?', r'\d+\s*participants?',
+        r'sample\s+of\s+\d+', r'n\s*=\s*\d+', r'\d+\s*interviews?',
+    ]
+
+    # Patterns that mark a claim as a statistical result
+    STAT_CLAIM_PATTERNS = [
+        r'β\s*=', r'p\s*[<>=]', r'coefficient', r'significant',
+        r'percentage\s*point', r'mean\s*=', r'sd\s*=', r'correlation',
+    ]
+
+    # Directories listed concurrently during a scan
+    SCAN_WORKERS = 8
+
+    def __init__(self, max_workers: int = SCAN_WORKERS):
+        """
+        Initialize the inventory scanner.
+
+        Args:
+            max_workers: Maximum number of directories listed at once
+        """
+        self.max_workers = max(1, max_workers)
+        # One alternation per keyword list: a single regex search scans the
+        # string once instead of one substring pass per keyword
+        self._survey_name_re = self._keyword_pattern(self.SURVEY_KEYWORDS)
+        self._interview_name_re = self._keyword_pattern(self.INTERVIEW_KEYWORDS)
+        self._survey_claim_re = self._keyword_pattern(self.SURVEY_INDICATORS)
+        self._count_claim_re = self._union_pattern(self.COUNT_CLAIM_PATTERNS)
+        self._stat_claim_re = self._union_pattern(self.STAT_CLAIM_PATTERNS)
         self._stat_patterns = self._compile_stat_patterns()
 
-    def scan(self, data_path: str | Path) -> InventoryResult:
+    def scan(
+        self,
+        data_path: str | Path,
+        fetch_size: bool = True,
+        use_cache: bool = False,
+    ) -> InventoryResult:
         """
         Scan a data directory and catalog available files.
 
         Args:
             data_path: Path to the paper's data directory
+            fetch_size: Stat each file for its size. Pass False when only
+                the types are needed (saves a stat() per file, which is
+                slow on network filesystems); sizes are then reported as -1.
+            use_cache: Reuse a recent scan of an unchanged directory. Only the
+                root and its immediate entries are checked for changes, so
+                changes two or more levels down are missed until
+                clear_scan_cache() is called. Off by default.
 
         Returns:
             InventoryResult with cataloged files
@@ -150,34 +241,159 @@ class DataInventory:
                 missing_common=["data directory not found"],
             )
 
-        # Walk the directory
-        for root, dirs, filenames in os.walk(data_path):
-            # Skip hidden directories
-            dirs[:] = [d for d in dirs if not d.startswith('.')]
+        cache_key = self._scan_cache_key(data_path, fetch_size) if use_cache else None
+        if cache_key is not None:
+            with _scan_cache_lock:
+                cached = _scan_cache.get(cache_key)
+                if cached is not None:
+                    _scan_cache.move_to_end(cache_key)
+            if cached is not None:
+                return cached.copy()
+
+        # Scan directories concurrently; each listing is syscall-bound, so
+        # threads overlap the I/O. Results are stitched back together in
+        # top-down order afterwards so the file list stays deterministic.
+        root = str(data_path)
+        listings = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            pending = {executor.submit(self._scan_dir, root, fetch_size): root}
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    path = pending.pop(future)
+                    _, subdirs = listings[path] = future.result()
+                    for subdir in subdirs:
+                        future = executor.submit(self._scan_dir, subdir, fetch_size)
+                        pending[future] = subdir
+
+        # Group by type while stitching, rather than re-scanning the list;
+        # the counts and missing-type checks all come from the groups
+        by_type = {}
+
+        stack = [root]
+        while stack:
+            dir_files, subdirs = listings[stack.pop()]
+            for data_file in dir_files:
+                by_type.setdefault(data_file.data_type, []).append(data_file)
+            files.extend(dir_files)
+            stack.extend(reversed(subdirs))
+
+        tabular = len(by_type.get(DataType.SPREADSHEET, ()))
+        interview = (
+            len(by_type.get(DataType.INTERVIEW, ()))
+            + len(by_type.get(DataType.FIELDNOTES, ()))
+        )
+
+        # Check for common missing data types
+        missing = []
+        if DataType.SURVEY not in by_type:
+            missing.append("survey response data")
+        if DataType.INTERVIEW not in by_type:
+            missing.append("interview transcripts")
+
+        result = InventoryResult(
+            files=files,
+            total_files=len(files),
+            tabular_files=tabular,
+            interview_files=interview,
+            missing_common=missing,
+        )
+
+        if cache_key is not None:
+            # The cache keeps a private copy, so later edits by this caller
+            # don't leak into other callers' results
+            with _scan_cache_lock:
+                _scan_cache[cache_key] = result.copy()
+                while len(_scan_cache) > SCAN_CACHE_SIZE:
+                    _scan_cache.popitem(last=False)
 
-            for filename in filenames:
-                if filename.startswith('.'):
+        return result
+
+    def _scan_cache_key(self, data_path: Path, fetch_size: bool) -> Optional[tuple]:
+        """
+        Build the scan-cache key for a data directory.
+
+        The fingerprint is the root's mtime plus (name, mtime, size) of each
+        top-level entry, so adding, removing or touching anything in the
+        root or its immediate subdirectories invalidates the cached result.
+        Changes further down (e.g. data/interviews/site_a/new.txt) are not
+        seen; fingerprinting the whole tree would cost as much as the scan
+        it saves. Returns None if the directory can't be fingerprinted.
+        """
+        try:
+            root = data_path.resolve()
+            with os.scandir(root) as it:
+                entries = []
+                for entry in it:
+                    st = entry.stat(follow_symlinks=False)
+                    entries.append((entry.name, st.st_mtime_ns, st.st_size))
+            root_mtime = root.stat().st_mtime_ns
+        except OSError:
+            return None
+        entries.sort()
+        return (type(self), str(root), fetch_size, root_mtime, tuple(entries))
+
+    def _scan_dir(
+        self,
+        dir_path: str,
+        fetch_size: bool = True,
+    ) -> tuple[list[DataFile], list[str]]:
+        """
+        List a single directory.
+
+        Returns:
+            (data files found, non-hidden subdirectories to descend into)
+        """
+        files = []
+        subdirs = []
+
+        try:
+            it = os.scandir(dir_path)
+        except OSError:
+            return files, subdirs
+
+        with it:
+            for entry in it:
+                # Skip hidden files and directories
+                if entry.name.startswith('.'):
                     continue
 
-                filepath = Path(root) / filename
-                ext = filepath.suffix.lower()
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    # Don't descend into symlinked directories (avoids loops)
+                    if not entry.is_symlink():
+                        subdirs.append(entry.path)
+                    continue
+
+                filename = entry.name
+                # Lowercase once; the extension is a slice of the same string
+                name_lower = filename.lower()
+                dot = name_lower.rfind('.')
+                # Same rule as Path.suffix ("data." has none). Interned so
+                # every '.csv' DataFile shares one string object
+                ext = sys.intern(name_lower[dot:]) if 0 < dot < len(name_lower) - 1 else ''
 
                 data_type = self.EXTENSION_MAP.get(ext, DataType.UNKNOWN)
 
                 # Refine type based on filename keywords
-                name_lower = filename.lower()
-                if any(kw in name_lower for kw in self.SURVEY_KEYWORDS):
+                if self._survey_name_re.search(name_lower):
                     data_type = DataType.SURVEY
-                elif any(kw in name_lower for kw in self.INTERVIEW_KEYWORDS):
+                elif self._interview_name_re.search(name_lower):
                     data_type = DataType.INTERVIEW
 
-                try:
-                    size = filepath.stat().st_size
-                except OSError:
-                    size = 0
+                if fetch_size:
+                    try:
+                        size = entry.stat().st_size
+                    except OSError:
+                        size = 0
+                else:
+                    size = -1
 
                 data_file = DataFile(
-                    path=filepath,
+                    path=Path(entry.path),
                     name=filename,
                     data_type=data_type,
                     extension=ext,
@@ -186,24 +402,7 @@ class DataInventory:
 
                 files.append(data_file)
 
-        # Count by type
-        tabular = sum(1 for f in files if f.data_type == DataType.SPREADSHEET)
-        interview = sum(1 for f in files if f.data_type in [DataType.INTERVIEW, DataType.FIELDNOTES])
-
-        # Check for common missing data types
-        missing = []
-        if not any(f.data_type == DataType.SURVEY for f in files):
-            missing.append("survey response data")
-        if not any(f.data_type == DataType.INTERVIEW for f in files):
-            missing.append("interview transcripts")
-
-        return InventoryResult(
-            files=files,
-            total_files=len(files),
-            tabular_files=tabular,
-            interview_files=interview,
-            missing_common=missing,
-        )
+        return files, subdirs
 
     def verify_claim(self, claim: str, inventory: InventoryResult) -> DataClaim:
         """
@@ -264,30 +463,16 @@ class DataInventory:
         claim_lower = claim.lower()
 
         # Survey statistics
-        survey_indicators = [
-            'survey', 'respondent', 'response rate', 'likert',
-            'weekly measure', 'scale', 'questionnaire',
-        ]
-        if any(ind in claim_lower for ind in survey_indicators):
+        if self._survey_claim_re.search(claim_lower):
             return "survey_stat"
 
         # Worker counts, sample sizes
-        count_patterns = [
-            r'\d+\s*workers?', r'\d+\s*employees?', r'\d+\s*participants?',
-            r'sample\s+of\s+\d+', r'n\s*=\s*\d+', r'\d+\s*interviews?',
-        ]
-        for pattern in count_patterns:
-            if re.search(pattern, claim_lower):
-                return "count"
+        if self._count_claim_re.search(claim_lower):
+            return "count"
 
         # Statistical results
-        stat_patterns = [
-            r'β\s*=', r'p\s*[<>=]', r'coefficient', r'significant',
-            r'percentage\s*point', r'mean\s*=', r'sd\s*=', r'correlation',
-        ]
-        for pattern in stat_patterns:
-            if re.search(pattern, claim_lower):
-                return "statistic"
+        if self._stat_claim_re.search(claim_lower):
+            return "statistic"
 
         # Quotes
         if '"' in claim or '"' in claim or 'said' in claim_lower or 'noted' in claim_lower:
@@ -295,8 +480,20 @@ class DataInventory:
 
         return "other"
 
-    def _compile_stat_patterns(self) -> list:
-        """Compile regex patterns for statistical claims."""
+    @staticmethod
+    def _union_pattern(patterns: list[str], flags: int = 0) -> re.Pattern:
+        """Compile a list of regex patterns into one alternation."""
+        return re.compile('|'.join(f'(?:{p})' for p in patterns), flags)
+
+    @classmethod
+    def _keyword_pattern(cls, keywords: list[str]) -> re.Pattern:
+        """Compile a list of literal keywords into one alternation regex."""
+        return cls._union_pattern([re.escape(kw) for kw in keywords])
+
+    def _compile_stat_patterns(self) -> tuple[re.Pattern, ...]:
+        """Compile the statistical-claim patterns, one regex each."""
+        # Kept separate rather than fused: matches of different patterns
+        # overlap ("45 workers" inside "n = 45 workers") and each is a claim
         patterns = [
             r'\d+\s*workers?',
             r'\d+\s*weeks?',
@@ -309,7 +506,9 @@ class DataInventory:
             r'p\s*[<>=]\s*[\d\.]+',
             r'n\s*=\s*\d+',
         ]
-        return [re.compile(p, re.IGNORECASE) for p in patterns]
+        # Plain re on purpose: RE2's \d and \s are ASCII-only, which would make
+        # the claims found depend on whether an optional package is installed
+        return tuple(re.compile(p, re.IGNORECASE) for p in patterns)
 
     def extract_statistical_claims(self, text: str) -> list[str]:
         """
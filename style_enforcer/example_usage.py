@@ -6,13 +6,51 @@ This demonstrates how to use the style enforcer with different LLM backends.
 """
 
 import os
+from functools import lru_cache
 from typing import Optional
 
-# Import the style enforcer components
-from validator import StyleValidator, validate_paragraph
-from config import ManuscriptConfig, PaperType, QUANT_FORWARD_ORGSCI
-from exemplars import ExemplarDB, get_section_prompt_with_exemplar
-from orchestrator import ManuscriptOrchestrator
+# The style enforcer components are imported inside the functions that use
+# them, so running a single example (or just printing the Claude snippet)
+# doesn't pay for compiling every validator pattern and loading exemplars.
+
+
+# =============================================================================
+# Shared instances
+# =============================================================================
+# Validators and exemplar databases compile their patterns and load exemplar
+# data on construction, so the examples share one of each instead of
+# rebuilding them per example.
+
+@lru_cache(maxsize=None)
+def _validator():
+    from validator import StyleValidator
+    return StyleValidator()
+
+
+@lru_cache(maxsize=None)
+def _exemplar_db():
+    from exemplars import ExemplarDB
+    return ExemplarDB()
+
+
+_orchestrators: dict = {}
+
+
+def _orchestrator(config, llm_call):
+    """Return the shared orchestrator for this (config, llm_call) pair."""
+    from orchestrator import ManuscriptOrchestrator
+
+    # The cached orchestrator keeps config and llm_call alive, so their ids
+    # can't be reused by other objects while the entry exists
+    key = (id(config), id(llm_call))
+    orchestrator = _orchestrators.get(key)
+    if orchestrator is None:
+        orchestrator = _orchestrators[key] = ManuscriptOrchestrator(
+            config=config,
+            llm_call=llm_call,
+            verbose=True,
+        )
+    return orchestrator
 
 
 # =============================================================================
@@ -25,7 +63,7 @@ def example_validate_text():
     print("EXAMPLE 1: Validating existing text")
     print("="*60 + "\n")
 
-    validator = StyleValidator()
+    validator = _validator()
 
     # Bad text with violations
     bad_text = """
@@ -68,7 +106,7 @@ def example_get_exemplars():
     print("EXAMPLE 2: Getting exemplars for sections")
     print("="*60 + "\n")
 
-    db = ExemplarDB()
+    db = _exemplar_db()
 
     # Get introduction exemplar
     intro_exemplar = db.get("introduction")
@@ -94,6 +132,8 @@ def example_build_prompts():
     print("EXAMPLE 3: Building prompts with exemplars")
     print("="*60 + "\n")
 
+    from exemplars import get_section_prompt_with_exemplar
+
     prompt_addition = get_section_prompt_with_exemplar("findings")
     print("PROMPT ADDITION FOR FINDINGS SECTION:")
     print(prompt_addition[:1000] + "...")
@@ -103,25 +143,9 @@ def example_build_prompts():
 # Example 4: Full orchestration (requires LLM)
 # =============================================================================
 
-def example_full_orchestration(llm_call=None):
-    """
-    Demonstrate full manuscript orchestration.
-
-    Args:
-        llm_call: Function(system_prompt, user_prompt) -> response
-                  If None, uses a mock for demonstration.
-    """
-    print("\n" + "="*60)
-    print("EXAMPLE 4: Full orchestration")
-    print("="*60 + "\n")
-
-    if llm_call is None:
-        print("No LLM provided. Using mock for demonstration.")
-        print("In production, pass your LLM calling function.")
-        print()
-
-        def mock_llm(system: str, user: str) -> str:
-            return """This research extends person-environment fit theory by identifying
+def _mock_llm(system: str, user: str) -> str:
+    """Stand-in LLM used when no llm_call is passed to example 4."""
+    return """This research extends person-environment fit theory by identifying
 work orientation as a moderator of the misfit-response relationship. Standard P-E fit
 theory predicts that misfit leads to withdrawal: reduced effort, lower commitment, and
 exit. This prediction has strong empirical support and captures an important dynamic.
@@ -140,14 +164,29 @@ they desire permanent employment—intensify effort rather than withdraw. The qu
 evidence illuminates why: managers described career-oriented workers as "the ones who
 really care," visibly engaged from their first day."""
 
-        llm_call = mock_llm
 
-    # Create orchestrator
-    orchestrator = ManuscriptOrchestrator(
-        config=QUANT_FORWARD_ORGSCI,
-        llm_call=llm_call,
-        verbose=True,
-    )
+def example_full_orchestration(llm_call=None):
+    """
+    Demonstrate full manuscript orchestration.
+
+    Args:
+        llm_call: Function(system_prompt, user_prompt) -> response
+                  If None, uses a mock for demonstration.
+    """
+    print("\n" + "="*60)
+    print("EXAMPLE 4: Full orchestration")
+    print("="*60 + "\n")
+
+    if llm_call is None:
+        print("No LLM provided. Using mock for demonstration.")
+        print("In production, pass your LLM calling function.")
+        print()
+        llm_call = _mock_llm
+
+    from config import QUANT_FORWARD_ORGSCI
+
+    # Create orchestrator (shared across calls with the same LLM)
+    orchestrator = _orchestrator(QUANT_FORWARD_ORGSCI, llm_call)
 
     # Generate a section
     result = orchestrator.generate_section(
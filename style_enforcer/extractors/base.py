@@ -0,0 +1,198 @@
+"""
+Shared LLM client plumbing for the extractors.
+
+Clients may expose chat(), generate() or complete(), or simply be callable,
+and may add an async achat(). Which method to use, and whether it takes a
+separate `system` prompt, is worked out once per client here rather than
+probed on every call. Responses can be kept in a small LRU cache.
+"""
+
+import asyncio
+import hashlib
+import inspect
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+
+from .batching import MAX_BATCH_TASKS, pack_prompts, split_batch_response
+
+
+class LRUCache:
+    """
+    Thread-safe LRU mapping with an optional time-to-live.
+
+    get() returns None on a miss, so None can't be stored as a value. A
+    maxsize of 0 (or less) disables the cache.
+    """
+
+    def __init__(self, maxsize: int, ttl_seconds: Optional[float] = None):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[Any, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, value = entry
+            if self.ttl_seconds is not None and time.monotonic() - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: Any, value: Any) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _takes_system(method: Any) -> bool:
+    """Whether an LLM client method accepts a `system` keyword argument."""
+    if method is None:
+        return False
+    try:
+        return "system" in inspect.signature(method).parameters
+    except (TypeError, ValueError):
+        return False
+
+
+def _resolve_invoke(llm_client: Any) -> Optional[Callable[..., str]]:
+    """Pick the prompt -> str callable for this client, or None."""
+    # Support different LLM client interfaces
+    for name in ('chat', 'generate', 'complete'):
+        if hasattr(llm_client, name):
+            return getattr(llm_client, name)
+    if callable(llm_client):
+        return llm_client
+    return None
+
+
+class _LLMComponent:
+    """
+    Base for the extractors: sends prompts to a resolved LLM client.
+
+    Responses are cached as text keyed by (instructions, prompt) and parsed
+    again on every use, so callers never share mutable results.
+    """
+
+    def __init__(self, llm_client: Any, cache_size: int = 0):
+        self.llm = llm_client
+        self.cache = LRUCache(cache_size)
+        self._invoke = _resolve_invoke(llm_client)
+        self._invoke_takes_system = _takes_system(self._invoke)
+        self._ainvoke = getattr(llm_client, 'achat', None)
+        self._ainvoke_takes_system = _takes_system(self._ainvoke)
+
+    def _call_llm(self, prompt: str, system: Optional[str] = None) -> str:
+        """Call the LLM with the prompt, preceded by optional static instructions."""
+        if self._invoke is None:
+            raise ValueError(
+                "LLM client must have chat(), generate(), complete() method, "
+                "or be callable"
+            )
+
+        if system is not None:
+            # Clients that take a separate system prompt can cache it
+            if self._invoke_takes_system:
+                return self._invoke(prompt, system=system)
+            prompt = f"{system}\n\n{prompt}"
+
+        return self._invoke(prompt)
+
+    async def _acall_llm(self, prompt: str, system: Optional[str] = None) -> str:
+        """Call the LLM without blocking the event loop."""
+        if self._ainvoke is None:
+            return await asyncio.to_thread(self._call_llm, prompt, system)
+
+        if system is not None:
+            if self._ainvoke_takes_system:
+                return await self._ainvoke(prompt, system=system)
+            prompt = f"{system}\n\n{prompt}"
+
+        return await self._ainvoke(prompt)
+
+    def _ask(self, prompt: str, system: str, parse: Callable[[str], Any]) -> Any:
+        """Send a prompt (or reuse the response to an identical one) and parse it."""
+        key = self._response_key(system, prompt)
+        response = self.cache.get(key)
+        if response is None:
+            response = self._call_llm(prompt, system=system)
+        return self._parsed(key, response, parse)
+
+    async def _aask(self, prompt: str, system: str, parse: Callable[[str], Any]) -> Any:
+        """Async counterpart of _ask()."""
+        key = self._response_key(system, prompt)
+        response = self.cache.get(key)
+        if response is None:
+            response = await self._acall_llm(prompt, system=system)
+        return self._parsed(key, response, parse)
+
+    def _ask_many(
+        self,
+        prompts: list[str],
+        system: str,
+        parse: Callable[[str], Any],
+    ) -> list[Any]:
+        """
+        _ask() for several prompts that share instructions, in few LLM calls.
+
+        Cached prompts are answered from the cache; the rest are packed up
+        to MAX_BATCH_TASKS per request behind a single copy of `system`.
+        If a batch response can't be split, its prompts are sent one by one.
+        """
+        results: list[Any] = [None] * len(prompts)
+        pending = []
+        for i, prompt in enumerate(prompts):
+            key = self._response_key(system, prompt)
+            response = self.cache.get(key)
+            if response is not None:
+                results[i] = parse(response)
+            else:
+                pending.append((i, key))
+
+        for start in range(0, len(pending), MAX_BATCH_TASKS):
+            chunk = pending[start:start + MAX_BATCH_TASKS]
+            batch = None
+            if len(chunk) > 1:
+                packed = pack_prompts([prompts[i] for i, _ in chunk])
+                batch = split_batch_response(self._call_llm(packed, system=system), len(chunk))
+            for n, (i, key) in enumerate(chunk):
+                if batch is None:
+                    response = self._call_llm(prompts[i], system=system)
+                else:
+                    # Cached as the JSON the task would have returned alone
+                    response = json.dumps(batch[n])
+                results[i] = self._parsed(key, response, parse)
+
+        return results
+
+    def _parsed(self, key: bytes, response: str, parse: Callable[[str], Any]) -> Any:
+        result = parse(response)
+        # An empty result usually means the response didn't parse; retry it
+        if result:
+            self.cache.put(key, response)
+        return result
+
+    @staticmethod
+    def _response_key(system: str, prompt: str) -> bytes:
+        # The instructions name the task, so different templates never collide
+        return hashlib.blake2b(
+            system.encode() + b"\x00" + prompt.encode(),
+            digest_size=16,
+        ).digest()
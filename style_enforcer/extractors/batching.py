@@ -0,0 +1,63 @@
+"""
+Prompt packing for batch validation.
+
+Several single-paper prompts that share the same instructions are sent to
+the LLM as one request and the model returns one JSON result per task. The
+instructions go once, ahead of the packed tasks (as the system prompt where
+the client supports one), so only the per-paper text is repeated. This
+amortizes per-request overhead when validating many papers at once.
+"""
+
+import json
+from typing import Optional
+
+
+# Largest number of tasks packed into a single request
+MAX_BATCH_TASKS = 8
+
+
+BATCH_PROMPT = """You will complete {n} independent tasks. The instructions describe how to handle a single task: apply them to each task below separately, and do not let one task's text influence another.
+
+{tasks}
+
+Return valid JSON with this exact structure, one entry per task, in task order:
+{{
+  "results": [<JSON object for task 1>, <JSON object for task 2>, ...]
+}}"""
+
+
+def pack_prompts(prompts: list[str]) -> str:
+    """Combine single-task prompts (without their shared instructions) into one batch prompt."""
+    tasks = "\n\n".join(
+        f"=== TASK {i} ===\n{prompt}\n=== END TASK {i} ==="
+        for i, prompt in enumerate(prompts, 1)
+    )
+    return BATCH_PROMPT.format(n=len(prompts), tasks=tasks)
+
+
+def split_batch_response(response: str, expected: int) -> Optional[list[dict]]:
+    """
+    Split a batch response into per-task result dicts.
+
+    Returns None if the response is malformed or has the wrong number of
+    results, so callers can fall back to one request per task.
+    """
+    try:
+        # partition() stops at the first delimiter instead of splitting
+        # the whole response into a list
+        json_str = response
+        _, fence, rest = response.partition("```json")
+        if not fence:
+            _, fence, rest = response.partition("```")
+        if fence:
+            json_str = rest.partition("```")[0]
+
+        results = json.loads(json_str.strip()).get("results")
+    except (json.JSONDecodeError, AttributeError):
+        return None
+
+    if not isinstance(results, list) or len(results) != expected:
+        return None
+    if not all(isinstance(r, dict) for r in results):
+        return None
+    return results
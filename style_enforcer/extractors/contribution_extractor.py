@@ -7,11 +7,75 @@ are then used to check whether the theory section pre-announces them.
 """
 
 import json
-from dataclasses import dataclass
-from typing import Any, Optional
+import re
+from dataclasses import dataclass, fields
+from typing import Any, Optional, Sequence
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
-@dataclass
+try:
+    import msgspec
+    HAS_MSGSPEC = True
+except ImportError:
+    HAS_MSGSPEC = False
+
+from .base import _LLMComponent
+
+
+# LLM responses remembered per extractor, keyed by instructions + prompt digest
+EXTRACT_CACHE_SIZE = 64
+
+
+# A JSON object inside a markdown code fence (```json ... ``` or ``` ... ```)
+_FENCE_RE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL)
+
+# Fallback for unfenced responses: outermost {...} span
+_JSON_RE = re.compile(r"\{.*\}", re.DOTALL)
+
+
+def _json_text(response: str) -> str:
+    """Pull the JSON object out of an LLM response in a single regex pass."""
+    match = _FENCE_RE.search(response) or _JSON_RE.search(response)
+    if match is None:
+        return response.strip()
+    return match.group(match.lastindex or 0)
+
+
+# For decoding a JSON object that is followed by other text
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _json_loads(text: str) -> Any:
+    """
+    Parse JSON text, with orjson when it's installed.
+
+    If the text doesn't parse as a whole (typically the unfenced fallback
+    ran on into trailing prose that contains a brace), the first complete
+    object in it is decoded instead.
+    """
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers
+    # catch the same exception either way
+    try:
+        if HAS_ORJSON:
+            return orjson.loads(text)
+        return json.loads(text)
+    except json.JSONDecodeError:
+        start = text.find("{")
+        if start < 0:
+            raise
+        return _JSON_DECODER.raw_decode(text, start)[0]
+
+
+def _has_text(*sections: str) -> bool:
+    """Whether any of the sections has non-whitespace content."""
+    return any(section and not section.isspace() for section in sections)
+
+
+@dataclass(slots=True)
 class ExtractedContribution:
     """A contribution/claim extracted from findings or discussion."""
     claim: str                    # The substantive claim
@@ -21,16 +85,22 @@ class ExtractedContribution:
     named_concept_if_any: Optional[str] = None  # If the paper coins a term
 
     def to_dict(self) -> dict:
-        return {
-            "claim": self.claim,
-            "evidence_type": self.evidence_type,
-            "section_source": self.section_source,
-            "mechanism_if_any": self.mechanism_if_any,
-            "named_concept_if_any": self.named_concept_if_any,
-        }
+        return {name: getattr(self, name) for name in _CONTRIBUTION_FIELDS}
 
     @classmethod
     def from_dict(cls, data: dict, section: str = "unknown") -> "ExtractedContribution":
+        # Well-formed LLM output always has claim and evidence_type, so try
+        # direct subscription first and only fall back to defaults on a miss
+        try:
+            return cls(
+                data["claim"],
+                data["evidence_type"],
+                section,
+                data.get("mechanism_if_any"),
+                data.get("named_concept_if_any"),
+            )
+        except KeyError:
+            pass
         return cls(
             claim=data.get("claim", ""),
             evidence_type=data.get("evidence_type", "unknown"),
@@ -40,7 +110,29 @@ class ExtractedContribution:
         )
 
 
-EXTRACTION_PROMPT = """You are analyzing a qualitative/inductive research paper. Extract the paper's core contributions from its Findings and Discussion sections.
+# Field names in declaration order, resolved once instead of per to_dict()
+_CONTRIBUTION_FIELDS = tuple(f.name for f in fields(ExtractedContribution))
+
+
+if HAS_MSGSPEC:
+    class _ExtractedItem(msgspec.Struct):
+        """One entry of the extraction response, as the prompt specifies it."""
+        claim: str = ""
+        evidence_type: str = "unknown"
+        mechanism_if_any: Optional[str] = None
+        named_concept_if_any: Optional[str] = None
+
+    class _ExtractionResponse(msgspec.Struct):
+        contributions: list[_ExtractedItem] = []
+
+    # Typed decoder: parses and validates the response in one C-level pass
+    _EXTRACTION_DECODER = msgspec.json.Decoder(_ExtractionResponse)
+
+
+# Static instructions go first (as the system prompt where the client
+# supports one) so providers can cache them across calls; only the section
+# text in EXTRACTION_PROMPT varies.
+EXTRACTION_INSTRUCTIONS = """You are analyzing a qualitative/inductive research paper. Extract the paper's core contributions from its Findings and Discussion sections.
 
 For each contribution, identify:
 1. The substantive claim (what the paper argues it discovered)
@@ -51,32 +143,37 @@ For each contribution, identify:
 Be thorough - capture ALL claims the paper makes about what it found.
 Focus on SUBSTANTIVE claims, not methodological notes or literature reviews.
 
-FINDINGS SECTION:
-{findings_text}
-
----
-
-DISCUSSION SECTION:
-{discussion_text}
-
----
-
 Return your analysis as valid JSON with this exact structure:
-{{
+{
   "contributions": [
-    {{
+    {
       "claim": "The substantive claim in a single sentence",
       "mechanism_if_any": "The causal mechanism if the paper explains WHY/HOW, or null",
       "named_concept_if_any": "Any coined term like 'shadow learning' or 'developmental uncertainty', or null",
       "evidence_type": "qual_finding" | "quant_result" | "theoretical_extension"
-    }}
+    }
   ]
-}}
+}
 
 Extract 3-8 core contributions. Prioritize the most important claims."""
 
 
-class ContributionExtractor:
+EXTRACTION_PROMPT = """FINDINGS SECTION:
+{findings_text}
+
+---
+
+DISCUSSION SECTION:
+{discussion_text}"""
+
+# EXTRACTION_PROMPT split around its two fields once, so building a prompt
+# is plain concatenation rather than re-parsing the format string
+_PROMPT_HEAD, _, _rest = EXTRACTION_PROMPT.partition("{findings_text}")
+_PROMPT_MID, _, _PROMPT_TAIL = _rest.partition("{discussion_text}")
+del _rest
+
+
+class ContributionExtractor(_LLMComponent):
     """
     Extracts contributions from paper findings and discussion using LLM.
 
@@ -85,21 +182,25 @@ class ContributionExtractor:
         contributions = extractor.extract(findings_text, discussion_text)
     """
 
-    def __init__(self, llm_client: Any):
+    def __init__(self, llm_client: Any, cache_size: int = EXTRACT_CACHE_SIZE):
         """
         Initialize with an LLM client.
 
         Args:
             llm_client: Any LLM client with a chat() or generate() method.
                        Expected interface: client.chat(prompt) -> str
+                       Clients whose chat() also takes a `system` keyword get
+                       the static instructions separately, for prompt caching.
+            cache_size: Number of LLM responses to keep, so re-extracting
+                       unchanged sections skips the round-trip (0 disables)
         """
-        self.llm = llm_client
+        super().__init__(llm_client, cache_size)
 
     def extract(
         self,
         findings: str,
         discussion: str,
-    ) -> list[ExtractedContribution]:
+    ) -> tuple[ExtractedContribution, ...]:
         """
         Extract contributions from findings and discussion sections.
 
@@ -108,69 +209,115 @@ class ContributionExtractor:
             discussion: The discussion section text
 
         Returns:
-            List of extracted contributions
+            Tuple of extracted contributions
         """
-        if not findings and not discussion:
-            return []
+        # Whitespace-only sections have nothing to extract
+        if not _has_text(findings, discussion):
+            return ()
+
+        return self._ask(
+            self._build_prompt(findings, discussion),
+            EXTRACTION_INSTRUCTIONS,
+            self._parse_response,
+        )
 
-        # Build the prompt
-        prompt = EXTRACTION_PROMPT.format(
-            findings_text=findings or "(No findings section provided)",
-            discussion_text=discussion or "(No discussion section provided)",
+    async def aextract(
+        self,
+        findings: str,
+        discussion: str,
+    ) -> tuple[ExtractedContribution, ...]:
+        """Async version of extract()."""
+        # Whitespace-only sections have nothing to extract
+        if not _has_text(findings, discussion):
+            return ()
+
+        return await self._aask(
+            self._build_prompt(findings, discussion),
+            EXTRACTION_INSTRUCTIONS,
+            self._parse_response,
         )
 
-        # Call the LLM
-        response = self._call_llm(prompt)
-
-        # Parse the response
-        return self._parse_response(response)
-
-    def _call_llm(self, prompt: str) -> str:
-        """Call the LLM with the prompt."""
-        # Support different LLM client interfaces
-        if hasattr(self.llm, 'chat'):
-            return self.llm.chat(prompt)
-        elif hasattr(self.llm, 'generate'):
-            return self.llm.generate(prompt)
-        elif hasattr(self.llm, 'complete'):
-            return self.llm.complete(prompt)
-        elif callable(self.llm):
-            return self.llm(prompt)
-        else:
-            raise ValueError(
-                "LLM client must have chat(), generate(), complete() method, "
-                "or be callable"
-            )
+    def extract_batch(
+        self,
+        papers: list[tuple[str, str]],
+    ) -> list[tuple[ExtractedContribution, ...]]:
+        """
+        Extract contributions for several papers with as few LLM calls as possible.
 
-    def _parse_response(self, response: str) -> list[ExtractedContribution]:
-        """Parse LLM response into ExtractedContribution objects."""
-        try:
-            # Try to extract JSON from response
-            # Handle case where LLM wraps JSON in markdown code blocks
-            json_str = response
-            if "```json" in response:
-                json_str = response.split("```json")[1].split("```")[0]
-            elif "```" in response:
-                json_str = response.split("```")[1].split("```")[0]
+        Up to MAX_BATCH_TASKS papers are packed into each request behind one
+        copy of the instructions; papers already in the cache are skipped,
+        and if a batch response can't be split, those papers are extracted
+        one by one.
+
+        Args:
+            papers: (findings, discussion) text pairs
+
+        Returns:
+            One list of contributions per paper, in input order
+        """
+        results: list[tuple[ExtractedContribution, ...]] = [() for _ in papers]
+        pending = [i for i, texts in enumerate(papers) if _has_text(*texts)]
+
+        extracted = self._ask_many(
+            [self._build_prompt(*papers[i]) for i in pending],
+            EXTRACTION_INSTRUCTIONS,
+            self._parse_response,
+        )
+        for i, contributions in zip(pending, extracted):
+            results[i] = contributions
 
-            data = json.loads(json_str.strip())
-            contributions = []
+        return results
 
-            for item in data.get("contributions", []):
-                contrib = ExtractedContribution.from_dict(item, section="findings")
-                contributions.append(contrib)
+    def _build_prompt(self, findings: str, discussion: str) -> str:
+        return (
+            f"{_PROMPT_HEAD}{findings or '(No findings section provided)'}"
+            f"{_PROMPT_MID}{discussion or '(No discussion section provided)'}"
+            f"{_PROMPT_TAIL}"
+        )
+
+    def _parse_response(self, response: str) -> tuple[ExtractedContribution, ...]:
+        """Parse LLM response into ExtractedContribution objects."""
+        # Handles JSON wrapped in markdown code blocks or surrounded by prose
+        text = _json_text(response)
+        if HAS_MSGSPEC:
+            try:
+                parsed = _EXTRACTION_DECODER.decode(text)
+            except msgspec.DecodeError:
+                # Off-schema values (nulls, odd types) or prose after the
+                # object; the dict path below is more forgiving
+                pass
+            else:
+                return tuple(
+                    ExtractedContribution(
+                        item.claim,
+                        item.evidence_type,
+                        "findings",
+                        item.mechanism_if_any,
+                        item.named_concept_if_any,
+                    )
+                    for item in parsed.contributions
+                )
 
-            return contributions
+        try:
+            data = _json_loads(text)
+            return self._contributions_from_data(data)
 
         except (json.JSONDecodeError, KeyError, IndexError) as e:
             # If parsing fails, return empty list
             # In production, would log this error
             print(f"Warning: Failed to parse LLM response: {e}")
-            return []
+            return ()
+
+    def _contributions_from_data(self, data: dict) -> tuple[ExtractedContribution, ...]:
+        """Build contributions from a parsed extraction result."""
+        return tuple(
+            ExtractedContribution.from_dict(item, section="findings")
+            for item in data.get("contributions", ())
+        )
 
     def extract_summary(
         self,
-        contributions: list[ExtractedContribution],
+        contributions: Sequence[ExtractedContribution],
     ) -> str:
         """
         Generate a summary of contributions for use in other prompts.
@@ -184,13 +331,9 @@ class ContributionExtractor:
         if not contributions:
             return "(No contributions extracted)"
 
-        lines = []
-        for i, c in enumerate(contributions, 1):
-            line = f"{i}. {c.claim}"
-            if c.named_concept_if_any:
-                line += f" [concept: '{c.named_concept_if_any}']"
-            if c.mechanism_if_any:
-                line += f" [mechanism: {c.mechanism_if_any}]"
-            lines.append(line)
-
-        return "\n".join(lines)
+        return "\n".join(
+            f"{i}. {c.claim}"
+            + (f" [concept: '{c.named_concept_if_any}']" if c.named_concept_if_any else "")
+            + (f" [mechanism: {c.mechanism_if_any}]" if c.mechanism_if_any else "")
+            for i, c in enumerate(contributions, 1)
+        )
@@ -6,11 +6,18 @@ sections properly set up a puzzle → gap → question flow WITHOUT pre-announci
 the findings that should emerge later.
 """
 
+import asyncio
 import json
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Any, Optional
 
-from .contribution_extractor import ExtractedContribution
+from .base import _LLMComponent
+from .contribution_extractor import ExtractedContribution, _json_loads, _json_text
+
+
+# LLM responses remembered per analyzer, keyed by instructions + prompt digest
+ANALYZE_CACHE_SIZE = 64
 
 
 @dataclass
@@ -21,6 +28,23 @@ class PreannouncementEvidence:
     similarity_explanation: str  # Why these are considered similar
     severity: str = "high"      # "high", "medium", "low"
 
+    def to_dict(self) -> dict:
+        return {
+            "finding_claim": self.finding_claim,
+            "theory_text": self.theory_text,
+            "similarity_explanation": self.similarity_explanation,
+            "severity": self.severity,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "PreannouncementEvidence":
+        return cls(
+            finding_claim=data.get("finding_claim", ""),
+            theory_text=data.get("theory_text", ""),
+            similarity_explanation=data.get("similarity_explanation", ""),
+            severity=data.get("severity", "high"),
+        )
+
 
 @dataclass
 class TheoryAnalysis:
@@ -31,6 +55,33 @@ class TheoryAnalysis:
     preannouncements: list[PreannouncementEvidence] = field(default_factory=list)
     overall_structure: str = "unknown"  # "inductive", "deductive", "mixed"
     structure_rating: int = 3  # 1-5, where 5 is pure inductive discovery
+    # False when neither LLM pass returned usable JSON, so every field above
+    # is a default rather than a judgement; such analyses aren't cached
+    parsed: bool = True
+
+    def to_dict(self) -> dict:
+        return {
+            "prior_concepts": self.prior_concepts,
+            "gap_statement": self.gap_statement,
+            "research_questions": self.research_questions,
+            "preannouncements": [p.to_dict() for p in self.preannouncements],
+            "overall_structure": self.overall_structure,
+            "structure_rating": self.structure_rating,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "TheoryAnalysis":
+        return cls(
+            prior_concepts=list(data.get("prior_concepts", [])),
+            gap_statement=data.get("gap_statement"),
+            research_questions=list(data.get("research_questions", [])),
+            preannouncements=[
+                PreannouncementEvidence.from_dict(p)
+                for p in data.get("preannouncements", [])
+            ],
+            overall_structure=data.get("overall_structure", "unknown"),
+            structure_rating=data.get("structure_rating", 3),
+        )
 
     @property
     def has_preannouncements(self) -> bool:
@@ -45,7 +96,10 @@ class TheoryAnalysis:
         )
 
 
-PREANNOUNCEMENT_PROMPT = """You are analyzing whether a theory section pre-announces findings (a violation for inductive papers).
+# Each check is split into static instructions (sent first, as the system
+# prompt where the client supports one, so providers can cache them) and a
+# template holding only the paper text.
+PREANNOUNCEMENT_INSTRUCTIONS = """You are analyzing whether a theory section pre-announces findings (a violation for inductive papers).
 
 CONTEXT: In inductive qualitative papers, the theory section should:
 - Review PRIOR literature and concepts (what others have found/theorized)
@@ -55,17 +109,9 @@ CONTEXT: In inductive qualitative papers, the theory section should:
 
 The key test: Does the theory section describe what THIS PAPER discovers, or only what PRIOR WORK has established?
 
-FINDINGS/CONTRIBUTIONS (extracted from the paper's findings/discussion):
-{contributions_text}
-
----
-
-THEORY SECTION TEXT:
-{theory_text}
+You will be given the paper's findings/contributions (extracted from its findings/discussion) and its theory section text.
 
----
-
-For each finding/contribution listed above, check if the theory section ALREADY describes it.
+For each finding/contribution provided, check if the theory section ALREADY describes it.
 A pre-announcement occurs when the theory section:
 - Describes the same mechanism/dynamic the findings reveal
 - Names the same concept that findings introduce
@@ -73,25 +119,34 @@ A pre-announcement occurs when the theory section:
 - States as fact what findings should discover
 
 Return your analysis as valid JSON with this exact structure:
-{{
+{
   "preannouncements": [
-    {{
+    {
       "finding_claim": "The contribution/finding being pre-announced",
       "theory_text_that_preannounces": "The exact text from theory section",
       "similarity_explanation": "Why this counts as pre-announcing the finding",
       "severity": "high" | "medium" | "low"
-    }}
+    }
   ],
   "gap_statement_if_present": "The gap statement if one exists, or null",
   "research_questions": ["Each research question posed in the theory section"],
   "overall_structure": "inductive" | "deductive" | "mixed",
   "prior_concepts": ["Key concepts from prior literature (not from this paper)"]
-}}
+}
 
 Be strict: If the theory section describes what managers DO, what facilities ARE, how mechanisms WORK - and these match the findings - that's a pre-announcement."""
 
 
-STRUCTURE_PROMPT = """You are checking whether a paper has proper inductive structure.
+PREANNOUNCEMENT_PROMPT = """FINDINGS/CONTRIBUTIONS (extracted from the paper's findings/discussion):
+{contributions_text}
+
+---
+
+THEORY SECTION TEXT:
+{theory_text}"""
+
+
+STRUCTURE_INSTRUCTIONS = """You are checking whether a paper has proper inductive structure.
 
 PROPER INDUCTIVE STRUCTURE (discovery):
 1. PUZZLE: "Here's a phenomenon that existing theory doesn't explain well"
@@ -107,24 +162,9 @@ PROBLEMATIC HYPO-DEDUCTIVE STRUCTURE (confirmation):
 Key diagnostic: When you reach the findings, do they feel SURPRISING (discovery) or EXPECTED (confirmation)?
 If the theory section told you what you'd find, it's confirmation disguised as discovery.
 
----
-
-INTRODUCTION:
-{intro_text}
+You will be given the paper's introduction, theory section, and a summary of its findings.
 
----
-
-THEORY SECTION:
-{theory_text}
-
----
-
-FINDINGS SUMMARY (what the paper claims to discover):
-{findings_summary}
-
----
-
-Analyze this paper and rate its structure from 1-5:
+Analyze the paper and rate its structure from 1-5:
 - 5: Pure inductive discovery - theory sets up puzzle, findings are surprising
 - 4: Mostly inductive - minor preview but mainly discovery
 - 3: Mixed - some substantial preview, some discovery
@@ -132,16 +172,30 @@ Analyze this paper and rate its structure from 1-5:
 - 1: Pure deductive - theory describes exactly what findings show
 
 Return your analysis as valid JSON:
-{{
+{
   "structure_rating": <1-5>,
   "puzzle_statement": "The puzzle if one is clearly articulated, or null",
   "gap_statement": "The gap in literature if clearly stated, or null",
   "preview_evidence": ["Any text that previews/pre-announces findings"],
   "diagnosis": "Your assessment of why this structure is inductive or deductive"
-}}"""
+}"""
+
 
+STRUCTURE_PROMPT = """INTRODUCTION:
+{intro_text}
+
+---
+
+THEORY SECTION:
+{theory_text}
 
-class TheoryAnalyzer:
+---
+
+FINDINGS SUMMARY (what the paper claims to discover):
+{findings_summary}"""
+
+
+class TheoryAnalyzer(_LLMComponent):
     """
     Analyzes intro/theory sections for proper inductive structure.
 
@@ -150,14 +204,16 @@ class TheoryAnalyzer:
         analysis = analyzer.analyze(intro, theory, contributions)
     """
 
-    def __init__(self, llm_client: Any):
+    def __init__(self, llm_client: Any, cache_size: int = ANALYZE_CACHE_SIZE):
         """
         Initialize with an LLM client.
 
         Args:
             llm_client: Any LLM client with a chat() or generate() method.
+            cache_size: Number of LLM responses to keep, so re-analyzing an
+                       unchanged draft skips the round-trips (0 disables)
         """
-        self.llm = llm_client
+        super().__init__(llm_client, cache_size)
 
     def analyze(
         self,
@@ -176,20 +232,82 @@ class TheoryAnalyzer:
         Returns:
             TheoryAnalysis with structure assessment and pre-announcement detection
         """
-        # First, check for pre-announcements
-        preannouncement_result = self._check_preannouncements(
-            theory,
-            contributions,
+        if not theory:
+            # No pre-announcement check to run, so nothing to overlap
+            return self._combine({}, self._check_structure(intro, theory, contributions))
+
+        # The two checks are independent LLM round-trips: run the
+        # pre-announcement check on a worker thread while the structure
+        # check runs here
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            pending = pool.submit(self._check_preannouncements, theory, contributions)
+            structure_result = self._check_structure(intro, theory, contributions)
+            preannouncement_result = pending.result()
+
+        return self._combine(preannouncement_result, structure_result)
+
+    async def aanalyze(
+        self,
+        intro: str,
+        theory: str,
+        contributions: list[ExtractedContribution],
+    ) -> TheoryAnalysis:
+        """
+        Async version of analyze().
+
+        The pre-announcement and structure checks are independent of each
+        other, so both prompts are sent concurrently.
+        """
+        preannouncement_result, structure_result = await asyncio.gather(
+            self._acheck_preannouncements(theory, contributions),
+            self._acheck_structure(intro, theory, contributions),
         )
+        return self._combine(preannouncement_result, structure_result)
+
+    def analyze_batch(
+        self,
+        papers: list[tuple[str, str, list[ExtractedContribution]]],
+    ) -> list[TheoryAnalysis]:
+        """
+        Analyze several papers, packing their prompts into shared LLM calls.
+
+        Each paper contributes a structure prompt and, if it has a theory
+        section, a pre-announcement prompt. Prompts of the same kind are packed
+        together behind one copy of their instructions; cached prompts are
+        skipped, and prompts that can't be recovered from a batch response
+        are re-sent individually.
 
-        # Then, check overall structure
-        structure_result = self._check_structure(
-            intro,
-            theory,
-            contributions,
+        Args:
+            papers: (intro, theory, contributions) per paper
+
+        Returns:
+            One TheoryAnalysis per paper, in input order
+        """
+        # Each check is batched separately, so a request carries one set of
+        # instructions; papers without a theory section skip pre-announcement
+        with_theory = [i for i, (_, theory, _) in enumerate(papers) if theory]
+        preannouncement_results = self._ask_many(
+            [self._preannouncement_prompt(papers[i][1], papers[i][2]) for i in with_theory],
+            PREANNOUNCEMENT_INSTRUCTIONS,
+            self._parse_json_response,
+        )
+        structure_results = self._ask_many(
+            [self._structure_prompt(*paper) for paper in papers],
+            STRUCTURE_INSTRUCTIONS,
+            self._parse_json_response,
         )
 
-        # Combine results
+        preannouncements: list[dict] = [{} for _ in papers]
+        for i, result in zip(with_theory, preannouncement_results):
+            preannouncements[i] = result
+
+        return [
+            self._combine(preannouncement, structure)
+            for preannouncement, structure in zip(preannouncements, structure_results)
+        ]
+
+    def _combine(self, preannouncement_result: dict, structure_result: dict) -> TheoryAnalysis:
+        """Merge the two LLM passes into a TheoryAnalysis."""
         return TheoryAnalysis(
             prior_concepts=preannouncement_result.get("prior_concepts", []),
             gap_statement=preannouncement_result.get("gap_statement_if_present")
@@ -206,6 +324,7 @@ class TheoryAnalyzer:
             ],
             overall_structure=preannouncement_result.get("overall_structure", "unknown"),
             structure_rating=structure_result.get("structure_rating", 3),
+            parsed=bool(preannouncement_result or structure_result),
         )
 
     def _check_preannouncements(
@@ -217,6 +336,25 @@ class TheoryAnalyzer:
         if not theory:
             return {}
 
+        prompt = self._preannouncement_prompt(theory, contributions)
+        return self._ask(prompt, PREANNOUNCEMENT_INSTRUCTIONS, self._parse_json_response)
+
+    async def _acheck_preannouncements(
+        self,
+        theory: str,
+        contributions: list[ExtractedContribution],
+    ) -> dict:
+        if not theory:
+            return {}
+
+        prompt = self._preannouncement_prompt(theory, contributions)
+        return await self._aask(prompt, PREANNOUNCEMENT_INSTRUCTIONS, self._parse_json_response)
+
+    def _preannouncement_prompt(
+        self,
+        theory: str,
+        contributions: list[ExtractedContribution],
+    ) -> str:
         # Format contributions for prompt
         contrib_lines = []
         for i, c in enumerate(contributions, 1):
@@ -229,14 +367,11 @@ class TheoryAnalyzer:
 
         contributions_text = "\n".join(contrib_lines) if contrib_lines else "(No contributions)"
 
-        prompt = PREANNOUNCEMENT_PROMPT.format(
+        return PREANNOUNCEMENT_PROMPT.format(
             contributions_text=contributions_text,
             theory_text=theory,
         )
 
-        response = self._call_llm(prompt)
-        return self._parse_json_response(response)
-
     def _check_structure(
         self,
         intro: str,
@@ -244,47 +379,40 @@ class TheoryAnalyzer:
         contributions: list[ExtractedContribution],
     ) -> dict:
         """Check overall puzzle → gap → question → answer structure."""
+        prompt = self._structure_prompt(intro, theory, contributions)
+        return self._ask(prompt, STRUCTURE_INSTRUCTIONS, self._parse_json_response)
+
+    async def _acheck_structure(
+        self,
+        intro: str,
+        theory: str,
+        contributions: list[ExtractedContribution],
+    ) -> dict:
+        prompt = self._structure_prompt(intro, theory, contributions)
+        return await self._aask(prompt, STRUCTURE_INSTRUCTIONS, self._parse_json_response)
+
+    def _structure_prompt(
+        self,
+        intro: str,
+        theory: str,
+        contributions: list[ExtractedContribution],
+    ) -> str:
         # Create findings summary
         findings_summary = "\n".join(
             f"- {c.claim}" for c in contributions
         ) if contributions else "(No findings extracted)"
 
-        prompt = STRUCTURE_PROMPT.format(
+        return STRUCTURE_PROMPT.format(
             intro_text=intro or "(No introduction provided)",
             theory_text=theory or "(No theory section provided)",
             findings_summary=findings_summary,
         )
 
-        response = self._call_llm(prompt)
-        return self._parse_json_response(response)
-
-    def _call_llm(self, prompt: str) -> str:
-        """Call the LLM with the prompt."""
-        if hasattr(self.llm, 'chat'):
-            return self.llm.chat(prompt)
-        elif hasattr(self.llm, 'generate'):
-            return self.llm.generate(prompt)
-        elif hasattr(self.llm, 'complete'):
-            return self.llm.complete(prompt)
-        elif callable(self.llm):
-            return self.llm(prompt)
-        else:
-            raise ValueError(
-                "LLM client must have chat(), generate(), complete() method, "
-                "or be callable"
-            )
-
     def _parse_json_response(self, response: str) -> dict:
         """Parse JSON from LLM response."""
         try:
-            json_str = response
-            if "```json" in response:
-                json_str = response.split("```json")[1].split("```")[0]
-            elif "```" in response:
-                json_str = response.split("```")[1].split("```")[0]
-
-            return json.loads(json_str.strip())
+            return _json_loads(_json_text(response))
 
-        except (json.JSONDecodeError, KeyError, IndexError) as e:
+        except json.JSONDecodeError as e:
             print(f"Warning: Failed to parse LLM response: {e}")
             return {}
@@ -0,0 +1,145 @@
+"""
+Tests for the style CLI's LaTeX cleanup and coherence run.
+
+strip_latex_commands is checked against the original sequential
+implementation, on hand-written manuscript fragments and on random
+markup soup.
+"""
+
+import asyncio
+import random
+import re
+
+import pytest
+
+from .cli import (
+    arun_coherence_validation,
+    run_coherence_validation,
+    run_pattern_validation,
+    strip_latex_commands,
+)
+from .config import PaperType
+
+
+def _reference_strip(text: str) -> str:
+    """The original pass-by-pass cleanup, kept as the behavioural reference."""
+    text = re.sub(r'%.*$', '', text, flags=re.MULTILINE)
+    text = re.sub(r'\\textit\{([^}]*)\}', r'\1', text)
+    text = re.sub(r'\\textbf\{([^}]*)\}', r'\1', text)
+    text = re.sub(r'\\emph\{([^}]*)\}', r'\1', text)
+    text = re.sub(r'\\cite[pt]?\{[^}]*\}', '', text)
+    text = re.sub(r'\\(label|ref|eqref)\{[^}]*\}', '', text)
+    text = re.sub(r'\\begin\{(figure|table)\}.*?\\end\{\1\}', '', text, flags=re.DOTALL)
+    return text
+
+
+MANUSCRIPT_SAMPLES = [
+    "Intro.\n\\begin{figure}\\centering% old: \\end{figure}\n"
+    "\\caption{Rates}\n\\end{figure}\nText after.",
+    "\\textbf{bold % comment}\nnext line}",
+    "As \\citet{barley1990} argues, \\emph{roles} matter \\citep[p.~3]{orlikowski}.",
+    "\\textbf{a \\emph{b}} and \\textit{see \\cite{x}} in Section~\\ref{sec:theory}.",
+    "\\begin{table}\\label{tab:1}\\textit{n} = 45\\end{table}Workers (n = 45).",
+    "100\\% of sites \\eqref{eq:1} reported \\textit{learning}.",
+    "Plain text with no markup at all.",
+]
+
+_TOKENS = [
+    "\\textit{", "\\textbf{", "\\emph{", "\\cite{", "\\citep{", "\\ref{",
+    "\\label{", "\\begin{figure}", "\\end{figure}", "\\begin{table}",
+    "\\end{table}", "}", "{", "%", "\n", "a", " ", "b\\x", "\\",
+]
+
+
+def test_strip_latex_matches_reference_on_manuscripts():
+    for sample in MANUSCRIPT_SAMPLES:
+        assert strip_latex_commands(sample) == _reference_strip(sample), sample
+
+
+def test_commented_out_markup_is_removed_first():
+    text = MANUSCRIPT_SAMPLES[0]
+    assert strip_latex_commands(text) == "Intro.\n\nText after."
+
+
+def test_strip_latex_matches_reference_on_random_markup():
+    rng = random.Random(0)
+    for _ in range(20_000):
+        text = "".join(rng.choice(_TOKENS) for _ in range(rng.randint(0, 12)))
+        assert strip_latex_commands(text) == _reference_strip(text), repr(text)
+
+
+class PromptRecorder:
+    def __init__(self):
+        self.prompts = []
+
+    def chat(self, prompt: str, system: str = None) -> str:
+        self.prompts.append(prompt)
+        return "{}"
+
+
+LATEX_SECTIONS = {
+    "findings": "We find \\textbf{learning roles} at each site \\citep{a}.",
+    "discussion": "This \\emph{extends} prior work. % TODO cut",
+}
+
+
+def test_entry_points_still_strip_latex_by_format(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    client = PromptRecorder()
+    # The third positional argument is the document format, not a cache file
+    run_coherence_validation(LATEX_SECTIONS, client, "latex")
+    assert client.prompts and not any("\\textbf" in p or "TODO" in p for p in client.prompts)
+    assert list(tmp_path.iterdir()) == []
+
+    with pytest.raises(TypeError):
+        run_coherence_validation(LATEX_SECTIONS, client, "latex", "cache.sqlite")
+
+    stripped = {k: strip_latex_commands(v) for k, v in LATEX_SECTIONS.items()}
+    for name, result in run_pattern_validation(LATEX_SECTIONS, PaperType.QUAL_FORWARD).items():
+        expected = run_pattern_validation(stripped, PaperType.QUAL_FORWARD, doc_format=None)[name]
+        assert result.violations == expected.violations
+
+
+class ClosingClient:
+    """Async client that records whether it was closed, and on which loop."""
+
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.loops = []
+        self.closed_on = None
+
+    def chat(self, prompt: str, system: str = None) -> str:
+        return "{}"
+
+    async def achat(self, prompt: str, system: str = None) -> str:
+        self.loops.append(asyncio.get_running_loop())
+        if self.fail:
+            raise RuntimeError("connection reset")
+        return "{}"
+
+    async def aclose(self) -> None:
+        self.closed_on = asyncio.get_running_loop()
+
+
+def test_async_coherence_run_closes_client_on_its_loop():
+    sections = {"findings": "We find roles.", "discussion": "We contribute roles."}
+    client = ClosingClient()
+    asyncio.run(arun_coherence_validation(sections, client))
+    assert client.loops and client.closed_on is client.loops[0]
+
+    failing = ClosingClient(fail=True)
+    with pytest.raises(RuntimeError):
+        asyncio.run(arun_coherence_validation(sections, failing))
+    assert failing.closed_on is failing.loops[0]
+
+
+def test_sync_coherence_run_works_inside_a_running_loop():
+    sections = {"findings": "We find roles.", "discussion": "We contribute roles."}
+    client = ClosingClient()
+
+    async def notebook_cell():
+        return run_coherence_validation(sections, client)
+
+    report = asyncio.run(notebook_cell())
+    assert report.violations == []
+    assert client.loops == [] and client.closed_on is None
@@ -0,0 +1,44 @@
+"""
+Tests for CoherenceReport's derived properties.
+"""
+
+from dataclasses import fields
+
+from .coherence_validator import (
+    SEVERITY_CRITICAL,
+    SEVERITY_WARNING,
+    CoherenceReport,
+    CoherenceViolation,
+    CoherenceViolationType,
+)
+
+
+def _violation(severity: str) -> CoherenceViolation:
+    return CoherenceViolation(
+        type=CoherenceViolationType.FINDINGS_PREANNOUNCED,
+        severity=severity,
+        message="m",
+    )
+
+
+def test_severity_counts_follow_in_place_edits():
+    report = CoherenceReport(violations=[_violation(SEVERITY_CRITICAL)], structure_rating=5)
+    assert report.critical_count == 1
+    assert not report.is_properly_inductive
+
+    # Same list, same length, different severity
+    report.violations[0] = _violation(SEVERITY_WARNING)
+    assert report.critical_count == 0
+    assert report.warning_count == 1
+    assert report.is_properly_inductive
+
+    report.violations.pop()
+    report.violations.append(_violation(SEVERITY_CRITICAL))
+    assert report.critical_count == 1
+    assert report.warning_count == 0
+
+
+def test_report_fields_are_only_the_public_ones():
+    assert [f.name for f in fields(CoherenceReport)] == [
+        "contributions", "theory_analysis", "violations", "structure_rating",
+    ]
@@ -0,0 +1,30 @@
+"""
+Tests for the shared default section configurations.
+"""
+
+import dataclasses
+
+import pytest
+
+from .config import ManuscriptConfig, SectionConfig
+
+
+def test_default_sections_cannot_be_changed_through_one_config():
+    first = ManuscriptConfig()
+    second = ManuscriptConfig(total_word_target=9000)
+    abstract = first.get_section("abstract")
+    assert second.get_section("abstract") is abstract
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        abstract.max_words = 1
+    assert not hasattr(abstract.required_elements, "append")
+
+    variant = dataclasses.replace(abstract, max_words=1)
+    assert variant.max_words == 1
+    assert second.get_section("abstract").max_words == abstract.max_words != 1
+
+
+def test_section_element_lists_are_stored_as_tuples():
+    config = SectionConfig(name="Methods", required_elements=["sample", "coding"])
+    assert config.required_elements == ("sample", "coding")
+    assert config.prohibited_elements == ()
@@ -0,0 +1,138 @@
+"""
+Tests for the data inventory scanner and claim extraction.
+"""
+
+import re
+from dataclasses import replace
+from pathlib import Path
+
+from .data_inventory import DataInventory, DataType, clear_scan_cache
+
+
+# The original per-pattern claim extraction, kept as the behavioural reference
+_REFERENCE_STAT_PATTERNS = [
+    re.compile(p, re.IGNORECASE) for p in [
+        r'\d+\s*workers?',
+        r'\d+\s*weeks?',
+        r'\d+%\s*response\s*rate',
+        r'mean\s*[=:]?\s*\d+\.?\d*',
+        r'[Ss][Dd]\s*[=:]?\s*\d+\.?\d*',
+        r'kappa\s*[=:]?\s*\d+\.?\d*',
+        r'α\s*[=:]?\s*\d+\.?\d*',
+        r'β\s*=\s*[\d\.\-]+',
+        r'p\s*[<>=]\s*[\d\.]+',
+        r'n\s*=\s*\d+',
+    ]
+]
+
+
+def _reference_claims(text: str) -> list[str]:
+    claims = []
+    for pattern in _REFERENCE_STAT_PATTERNS:
+        for match in pattern.finditer(text):
+            start = max(0, match.start() - 50)
+            end = min(len(text), match.end() + 50)
+            claims.append(text[start:end].strip())
+    return claims
+
+
+METHODS_SAMPLE = (
+    "We interviewed staff at three sites (n = 45 workers) over 12 weeks. "
+    "Survey scores averaged mean = 3.4 (SD = 1.1; α = .86), with a 62% response rate. "
+    "Coders agreed (kappa 0.81). Automation predicted throughput, β = -0.32, p < .05, "
+    "across 136 workers and 2 weeks of follow-up."
+)
+
+
+def test_statistical_claims_match_reference():
+    inventory = DataInventory()
+    assert inventory.extract_statistical_claims(METHODS_SAMPLE) == _reference_claims(METHODS_SAMPLE)
+
+
+def test_overlapping_claims_are_all_kept():
+    claims = DataInventory().extract_statistical_claims("Sites (n = 45 workers) agreed.")
+    # "45 workers" and "n = 45" overlap; both are claims
+    assert len(claims) == 2
+
+
+def _make_data_dir(root):
+    (root / "interviews").mkdir()
+    (root / "survey_responses.csv").write_text("id,score\n1,4\n")
+    (root / "interviews" / "site_a.txt").write_text("transcript")
+    return root
+
+
+def test_cached_scans_are_independent_copies(tmp_path):
+    clear_scan_cache()
+    data_dir = _make_data_dir(tmp_path)
+
+    first = DataInventory().scan(data_dir, use_cache=True)
+    first.files[0].notes = "edited"
+    first.files[0].columns.append("score")
+    first.missing_common.append("edited")
+
+    second = DataInventory().scan(data_dir, use_cache=True)
+    assert second.total_files == 2
+    assert all(f.notes == "" and f.columns == [] for f in second.files)
+    assert "edited" not in second.missing_common
+    assert second.files[0] is not first.files[0]
+
+
+def test_scans_see_deep_changes_unless_cached(tmp_path):
+    clear_scan_cache()
+    data_dir = _make_data_dir(tmp_path)
+    inventory = DataInventory()
+    assert inventory.scan(data_dir, use_cache=True).total_files == 2
+
+    (data_dir / "codebook.xlsx").write_text("x")
+    assert inventory.scan(data_dir, use_cache=True).total_files == 3
+
+    site_b = data_dir / "interviews" / "site_b"
+    site_b.mkdir()
+    (site_b / "notes.txt").write_text("x")
+    assert inventory.scan(data_dir, use_cache=True).total_files == 4
+
+    # Two levels down: the default scan walks the tree and sees it...
+    (site_b / "memo.txt").write_text("x")
+    assert inventory.scan(data_dir).total_files == 5
+
+    # ...while the opt-in cache only fingerprints the root's entries
+    assert inventory.scan(data_dir, use_cache=True).total_files == 4
+    clear_scan_cache()
+    assert inventory.scan(data_dir, use_cache=True).total_files == 5
+
+
+def test_statistical_claims_use_unicode_digits_and_spaces():
+    # Arabic-Indic digits and a no-break space match \d and \s under re
+    text = "Across \u0661\u0662\u00a0workers the effect held."
+    assert DataInventory().extract_statistical_claims(text) == [text]
+
+
+def test_file_paths_are_paths(tmp_path):
+    result = DataInventory().scan(_make_data_dir(tmp_path))
+    survey = result.get_files_by_type(DataType.SURVEY)[0]
+    assert survey.path == tmp_path / "survey_responses.csv"
+    assert survey.path.suffix == survey.extension == ".csv"
+    assert survey.available
+
+
+def test_extensions_match_path_suffix(tmp_path):
+    names = ["data.", "Codebook.XLSX", "archive.tar.gz", "README", "a..b", "x.csv."]
+    for name in names:
+        (tmp_path / name).write_text("x")
+    files = DataInventory().scan(tmp_path).files
+    assert {f.name: f.extension for f in files} == {
+        name: Path(name).suffix.lower() for name in names
+    }
+
+
+def test_type_lookups_follow_edits_to_files(tmp_path):
+    result = DataInventory().scan(_make_data_dir(tmp_path))
+    assert result.has_data_type(DataType.SURVEY)
+
+    result.files = [f for f in result.files if f.data_type != DataType.SURVEY]
+    assert not result.has_data_type(DataType.SURVEY)
+
+    result.files.append(replace(result.files[0], name="extra.txt"))
+    assert len(result.get_files_by_type(DataType.INTERVIEW)) == 2
+    assert len(result.by_type[DataType.INTERVIEW]) == 2
@@ -0,0 +1,24 @@
+"""
+Tests for exemplar prompt assembly.
+"""
+
+from dataclasses import replace
+
+from .exemplars import get_exemplar, get_section_prompt_with_exemplar, get_section_prompts_bulk
+
+
+def test_bulk_prompts_match_single_lookups_in_order():
+    sections = ["Introduction", "abstract", "Introduction", "no_such_section"]
+    prompts = get_section_prompts_bulk(sections, journal="ASQ")
+
+    assert list(prompts) == ["Introduction", "abstract", "no_such_section"]
+    for section, prompt in prompts.items():
+        assert prompt == get_section_prompt_with_exemplar(section, "ASQ")
+    assert prompts["no_such_section"] == ""
+    assert "Style Exemplar" in prompts["Introduction"]
+
+
+def test_exemplars_compare_by_value():
+    exemplar = get_exemplar("introduction")
+    assert exemplar == replace(exemplar)
+    assert exemplar != replace(exemplar, text=exemplar.text + " More.")
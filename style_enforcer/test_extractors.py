@@ -0,0 +1,255 @@
+"""
+Tests for the LLM extractors' client dispatch, caching and batching.
+"""
+
+import asyncio
+import json
+
+from .coherence_validator import CoherenceResultCache, CoherenceValidator
+from .extractors import ContributionExtractor, TheoryAnalyzer
+from .extractors import base
+from .extractors.base import LRUCache
+from .extractors.batching import pack_prompts, split_batch_response
+
+
+EXTRACTION_RESPONSE = {
+    "contributions": [
+        {"claim": "Sites take on learning roles", "evidence_type": "qual_finding"},
+    ]
+}
+
+
+class RecordingClient:
+    """Sync + async client that records (prompt, system) per call."""
+
+    def __init__(self, response: dict):
+        self.response = json.dumps(response)
+        self.calls = []
+
+    def chat(self, prompt: str, system: str = None) -> str:
+        self.calls.append(("chat", prompt, system))
+        return self.response
+
+    async def achat(self, prompt: str, system: str = None) -> str:
+        self.calls.append(("achat", prompt, system))
+        return self.response
+
+
+class PlainClient:
+    """chat() without a system keyword and no async method."""
+
+    def __init__(self, response: dict):
+        self.response = json.dumps(response)
+        self.prompts = []
+
+    def chat(self, prompt: str) -> str:
+        self.prompts.append(prompt)
+        return self.response
+
+
+def test_client_methods_are_resolved_once(monkeypatch):
+    client = RecordingClient(EXTRACTION_RESPONSE)
+    extractor = ContributionExtractor(client)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("client signature inspected after __init__")
+
+    monkeypatch.setattr(base.inspect, "signature", fail)
+    extractor.extract("We find roles.", "We contribute roles.")
+    asyncio.run(extractor.aextract("We find roles again.", "We contribute roles."))
+
+    assert [(method, system is not None) for method, _, system in client.calls] == [
+        ("chat", True),
+        ("achat", True),
+    ]
+
+
+def test_clients_without_system_get_instructions_prefixed():
+    client = PlainClient(EXTRACTION_RESPONSE)
+    extractor = ContributionExtractor(client)
+
+    contributions = asyncio.run(extractor.aextract("We find roles.", ""))
+    assert [c.claim for c in contributions] == ["Sites take on learning roles"]
+    assert client.prompts[0].startswith("You are analyzing a qualitative")
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1  # "b" is now the oldest
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == (1, 3)
+
+
+def test_lru_cache_ttl_and_disabled(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr(base.time, "monotonic", lambda: clock[0])
+    cache = LRUCache(4, ttl_seconds=10)
+    cache.put("a", 1)
+    clock[0] += 11
+    assert cache.get("a") is None
+
+    disabled = LRUCache(0)
+    disabled.put("a", 1)
+    assert disabled.get("a") is None
+
+
+def test_component_cache_reuses_responses_per_prompt():
+    client = PlainClient(EXTRACTION_RESPONSE)
+    extractor = ContributionExtractor(client, cache_size=4)
+
+    first = extractor.extract("We find roles.", "")
+    second = extractor.extract("We find roles.", "")
+    assert len(client.prompts) == 1
+    # Hits are parsed afresh, so results aren't shared objects
+    assert [c.claim for c in first] == [c.claim for c in second]
+    assert first[0] is not second[0]
+
+    extractor.extract("We find something else.", "")
+    assert len(client.prompts) == 2
+
+    uncached = ContributionExtractor(client, cache_size=0)
+    uncached.extract("We find roles.", "")
+    uncached.extract("We find roles.", "")
+    assert len(client.prompts) == 4
+
+
+def test_unparseable_responses_are_not_cached():
+    client = PlainClient({})
+    client.response = "not json"
+    analyzer = TheoryAnalyzer(client)
+    analyzer.analyze("intro", "", [])
+    analyzer.analyze("intro", "", [])
+    assert len(client.prompts) == 2
+
+
+def test_validator_caches_at_one_layer():
+    client = PlainClient(EXTRACTION_RESPONSE)
+    validator = CoherenceValidator(client)
+    assert validator.contribution_extractor.cache.maxsize == 0
+    assert validator.theory_analyzer.cache.maxsize == 0
+
+    sections = {"findings": "We find roles.", "discussion": "We contribute roles."}
+    validator.validate(sections)
+    validator.validate(sections)
+    assert len(client.prompts) == 1
+    assert len(validator.contribution_extractor.cache) == 0
+
+
+class BatchClient(RecordingClient):
+    """Answers packed prompts with one result per task, or garbage if asked."""
+
+    def __init__(self, response: dict, split: bool = True):
+        super().__init__(response)
+        self.single = response
+        self.split = split
+
+    def chat(self, prompt: str, system: str = None) -> str:
+        self.calls.append(("chat", prompt, system))
+        n = prompt.count("=== END TASK")
+        if not n:
+            return self.response
+        if not self.split:
+            return "not json"
+        return json.dumps({"results": [self.single] * n})
+
+
+def test_batch_sends_instructions_once_and_fills_cache():
+    client = BatchClient(EXTRACTION_RESPONSE)
+    extractor = ContributionExtractor(client, cache_size=8)
+    papers = [(f"We find roles at site {i}.", "") for i in range(3)]
+
+    results = extractor.extract_batch(papers)
+    assert [len(r) for r in results] == [1, 1, 1]
+    assert len(client.calls) == 1
+    _, prompt, system = client.calls[0]
+    assert system.startswith("You are analyzing a qualitative")
+    assert "You are analyzing a qualitative" not in prompt
+
+    # Each paper is now cached individually, batched or not
+    extractor.extract(*papers[1])
+    extractor.extract_batch(papers + [("We find something else.", "")])
+    assert len(client.calls) == 2
+    assert "=== TASK" not in client.calls[1][1]
+
+
+def test_batch_falls_back_to_single_prompts():
+    client = BatchClient(EXTRACTION_RESPONSE, split=False)
+    extractor = ContributionExtractor(client)
+    results = extractor.extract_batch([("We find roles.", ""), ("", ""), ("We find more.", "")])
+    assert [len(r) for r in results] == [1, 0, 1]
+    # One failed batch, then each paper with text on its own
+    assert len(client.calls) == 3
+
+
+def test_analyze_batch_packs_each_check_separately():
+    client = BatchClient({"has_preannouncement": False, "structure_rating": 4})
+    analyzer = TheoryAnalyzer(client)
+    papers = [("intro a", "theory a", []), ("intro b", "", []), ("intro c", "theory c", [])]
+    results = analyzer.analyze_batch(papers)
+    assert len(results) == 3
+
+    systems = [system for _, _, system in client.calls]
+    assert len(systems) == 2 and systems[0] != systems[1]
+    # Only papers with a theory section get the pre-announcement check
+    assert sorted(prompt.count("=== END TASK") for _, prompt, _ in client.calls) == [2, 3]
+
+
+def test_pack_and_split_batch_round_trip():
+    packed = pack_prompts(["first paper", "second paper"])
+    assert packed.count("=== TASK") == 2
+    assert packed.index("first paper") < packed.index("second paper")
+
+    results = [{"a": 1}, {"b": 2}]
+    fenced = "Here you go:\n```json\n" + json.dumps({"results": results}) + "\n```"
+    assert split_batch_response(fenced, 2) == results
+    # Wrong count, non-dict entries and garbage all mean "fall back"
+    assert split_batch_response(json.dumps({"results": results}), 3) is None
+    assert split_batch_response(json.dumps({"results": [1, 2]}), 2) is None
+    assert split_batch_response("not json", 2) is None
+
+
+def test_unparsed_analysis_is_not_cached_or_reported():
+    client = PlainClient({})
+    client.response = "not json"
+    validator = CoherenceValidator(client)
+    sections = {"introduction": "We ask how sites learn.", "theory": "Prior work on learning."}
+
+    report = validator.validate(sections)
+    assert not report.theory_analysis.parsed
+    assert report.violations == []
+
+    # A later working reply is asked for, not shadowed by the failed analysis
+    client.response = json.dumps({"structure_rating": 5, "gap_statement": "We don't know Y"})
+    calls = len(client.prompts)
+    report = validator.validate(sections)
+    assert len(client.prompts) > calls
+    assert report.theory_analysis.parsed and report.structure_rating == 5
+
+
+def test_failed_parses_never_reach_the_disk_cache(tmp_path):
+    disk_cache = CoherenceResultCache(tmp_path / "coherence.sqlite", ttl_seconds=3600)
+    client = PlainClient({})
+    client.response = "not json"
+    sections = {
+        "introduction": "We ask how sites learn.",
+        "findings": "We find roles.",
+        "discussion": "We contribute roles.",
+    }
+    CoherenceValidator(client, disk_cache=disk_cache).validate(sections)
+    assert disk_cache._conn.execute("SELECT COUNT(*) FROM results").fetchone() == (0,)
+
+    # A later run with a working client calls the LLM instead of reading junk
+    working = PlainClient(EXTRACTION_RESPONSE)
+    CoherenceValidator(working, disk_cache=disk_cache).validate(sections)
+    assert working.prompts
+    disk_cache.close()
+
+
+def test_identical_extractions_compare_equal():
+    client = PlainClient(EXTRACTION_RESPONSE)
+    first = ContributionExtractor(client, cache_size=0).extract("We find roles.", "")
+    second = ContributionExtractor(client, cache_size=0).extract("We find roles.", "")
+    assert first == second and first[0] is not second[0]